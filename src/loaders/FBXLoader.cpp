@@ -9,6 +9,7 @@
 #include <cmath>
 #include <algorithm>
 #include <memory>
+#include <mutex>
 #include <ofbx.h>
 
 namespace FBXLoader {
@@ -146,6 +147,23 @@ struct SceneDeleter {
 
 using ScenePtr = std::unique_ptr<ofbx::IScene, SceneDeleter>;
 
+// OpenFBX reports parse errors through a process-wide static
+// (ofbx::Error::s_message) that is written during parsing, so concurrent
+// ofbx::load calls would race on it; guarding only a later ofbx::getError()
+// read would not prevent that. The whole parse is serialized here, which
+// makes FBX loading effectively serial; only file reads and scene
+// processing run in parallel.
+std::mutex g_ofbxLoadMutex;
+
+ScenePtr loadScene(const std::vector<uint8_t>& fileData) {
+    std::lock_guard<std::mutex> lock(g_ofbxLoadMutex);
+    return ScenePtr(ofbx::load(
+        fileData.data(),
+        static_cast<ofbx::usize>(fileData.size()),
+        static_cast<ofbx::u16>(ofbx::LoadFlags::NONE)
+    ));
+}
+
 // Extract texture path from FBX texture object
 std::string getTexturePath(const ofbx::Texture* texture, const std::string& fbxDirectory) {
     if (!texture) return "";
@@ -290,11 +308,7 @@ std::optional<GLTFSkinnedLoadResult> loadSkinned(const std::string& path, const
         return std::nullopt;
     }
 
-    ScenePtr scene(ofbx::load(
-        fileData.data(),
-        static_cast<ofbx::usize>(fileData.size()),
-        static_cast<ofbx::u16>(ofbx::LoadFlags::NONE)
-    ));
+    ScenePtr scene = loadScene(fileData);
 
     if (!scene) {
         SDL_Log("FBXLoader: Failed to parse FBX: %s", path.c_str());
@@ -804,11 +818,7 @@ std::vector<AnimationClip> loadAnimations(const std::string& path, const Skeleto
         return result;
     }
 
-    ScenePtr scene(ofbx::load(
-        fileData.data(),
-        static_cast<ofbx::usize>(fileData.size()),
-        static_cast<ofbx::u16>(ofbx::LoadFlags::NONE)
-    ));
+    ScenePtr scene = loadScene(fileData);
 
     if (!scene) {
         SDL_Log("FBXLoader: Failed to parse animation FBX: %s", path.c_str());
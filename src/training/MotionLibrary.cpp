@@ -5,14 +5,15 @@
 #include <SDL3/SDL_log.h>
 #include <filesystem>
 #include <algorithm>
+#include <atomic>
+#include <exception>
+#include <thread>
 
 namespace fs = std::filesystem;
 
 namespace training {
 
 int MotionLibrary::loadFromDirectory(const std::string& directory, const Skeleton& skeleton) {
-    int totalLoaded = 0;
-
     if (!fs::exists(directory) || !fs::is_directory(directory)) {
         SDL_LogError(SDL_LOG_CATEGORY_APPLICATION,
                      "MotionLibrary: Directory not found: %s", directory.c_str());
@@ -37,10 +38,12 @@ int MotionLibrary::loadFromDirectory(const std::string& directory, const Skeleto
     std::sort(fbxFiles.begin(), fbxFiles.end());
     SDL_Log("MotionLibrary: Found %zu FBX files in %s", fbxFiles.size(), directory.c_str());
 
+    std::vector<std::string> paths;
+    paths.reserve(fbxFiles.size());
     for (const auto& path : fbxFiles) {
-        int loaded = loadFile(path.string(), skeleton);
-        totalLoaded += loaded;
+        paths.push_back(path.string());
     }
+    int totalLoaded = loadFiles(paths, skeleton);
 
     SDL_Log("MotionLibrary: Loaded %d animation clips (total duration: %.1fs)",
             totalLoaded, totalDuration_);
@@ -49,8 +52,57 @@ int MotionLibrary::loadFromDirectory(const std::string& directory, const Skeleto
 
 int MotionLibrary::loadFile(const std::string& path, const Skeleton& skeleton) {
     // Use Mixamo preset (0.01 scale for cm→m, Y-up)
-    auto clips = FBXLoader::loadAnimations(path, skeleton, FBXPresets::Mixamo());
+    return addClips(path, FBXLoader::loadAnimations(path, skeleton, FBXPresets::Mixamo()));
+}
+
+int MotionLibrary::loadFiles(const std::vector<std::string>& paths, const Skeleton& skeleton) {
+    // Each file is independent, so files are loaded on a pool of threads (the
+    // skeleton is only read). FBXLoader serializes the OpenFBX parse, which
+    // is most of the cost, so only file reads and keyframe sampling overlap.
+    // Clips are added in order so the library contents don't depend on
+    // scheduling. An exception escaping a std::thread would
+    // terminate the process, so each file's error is captured and the first
+    // one (in path order) is rethrown once every worker has joined.
+    std::vector<std::vector<AnimationClip>> parsed(paths.size());
+    std::vector<std::exception_ptr> errors(paths.size());
+    std::atomic<size_t> next{0};
+    auto worker = [&]() {
+        for (size_t i = next++; i < paths.size(); i = next++) {
+            try {
+                parsed[i] = FBXLoader::loadAnimations(paths[i], skeleton, FBXPresets::Mixamo());
+            } catch (...) {
+                errors[i] = std::current_exception();
+            }
+        }
+    };
+
+    size_t numThreads = std::min<size_t>(
+        paths.size(), std::max(1u, std::thread::hardware_concurrency()));
+    std::vector<std::thread> threads;
+    for (size_t t = 1; t < numThreads; ++t) {
+        threads.emplace_back(worker);
+    }
+    worker();
+    for (auto& thread : threads) {
+        thread.join();
+    }
+
+    for (size_t i = 0; i < paths.size(); ++i) {
+        if (errors[i]) {
+            SDL_LogError(SDL_LOG_CATEGORY_APPLICATION,
+                         "MotionLibrary: Failed to load %s", paths[i].c_str());
+            std::rethrow_exception(errors[i]);
+        }
+    }
+
+    int totalLoaded = 0;
+    for (size_t i = 0; i < paths.size(); ++i) {
+        totalLoaded += addClips(paths[i], std::move(parsed[i]));
+    }
+    return totalLoaded;
+}
 
+int MotionLibrary::addClips(const std::string& path, std::vector<AnimationClip> clips) {
     if (clips.empty()) {
         SDL_LogWarn(SDL_LOG_CATEGORY_APPLICATION,
                     "MotionLibrary: No animations in %s", path.c_str());
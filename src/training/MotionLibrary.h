@@ -29,6 +29,13 @@ public:
     // Load a single FBX file. Returns number of clips loaded from it.
     int loadFile(const std::string& path, const Skeleton& skeleton);
 
+    // Load several FBX files on a pool of threads. File reads and keyframe
+    // sampling run concurrently, but FBXLoader serializes the OpenFBX parse,
+    // so parsing is effectively serial. Clips are added in the order of
+    // paths. Returns number of clips loaded. If any file throws,
+    // no clips are added and the first error in path order is rethrown.
+    int loadFiles(const std::vector<std::string>& paths, const Skeleton& skeleton);
+
     // Sample a random MotionFrame from a random clip at a random time.
     // The skeleton is used to compute FK (global joint positions).
     MotionFrame sampleRandomFrame(std::mt19937& rng, const Skeleton& skeleton) const;
@@ -55,6 +62,9 @@ private:
     std::vector<AnimationClip> clips_;
     float totalDuration_ = 0.0f;
 
+    // Add the usable clips parsed from path. Returns number of clips added.
+    int addClips(const std::string& path, std::vector<AnimationClip> clips);
+
     // Convert a sampled skeleton pose to a MotionFrame.
     static MotionFrame poseToMotionFrame(
         const Skeleton& skeleton,
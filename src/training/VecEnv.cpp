@@ -3,6 +3,7 @@
 #include "RagdollBuilder.h"
 
 #include <SDL3/SDL_log.h>
+#include <algorithm>
 #include <cmath>
 #include <cassert>
 
@@ -70,6 +71,7 @@ VecEnv::VecEnv(int numEnvs,
     ampObservations_.resize(static_cast<size_t>(numEnvs) * ampDim, 0.0f);
     rewards_.resize(numEnvs, 0.0f);
     dones_.resize(numEnvs, 0);
+    terminated_.resize(numEnvs, 0);
 
     // Reset all envs to a default standing pose spread across the grid
     reset();
@@ -189,6 +191,24 @@ void VecEnv::step(const float* actions, const std::vector<TaskGoal>& goals) {
     copyObsToBuffers();
 }
 
+void VecEnv::stepWithAutoReset(const float* actions) {
+    step(actions);
+
+    if (std::none_of(dones_.begin(), dones_.end(), [](uint8_t d) { return d != 0; })) {
+        return;
+    }
+
+    // resetDoneWithMotions() clears dones_; keep this step's flags for the
+    // caller. Copy rather than swap so dones_.data() stays stable for the
+    // persistent views handed out by the Python bindings.
+    std::copy(dones_.begin(), dones_.end(), terminated_.begin());
+    resetDoneWithMotions();
+    std::copy(terminated_.begin(), terminated_.end(), dones_.begin());
+
+    // Publish the initial observations of the environments that were reset
+    copyObsToBuffers();
+}
+
 void VecEnv::copyObsToBuffers() {
     int pDim = policyObsDim();
     int aDim = ampObsDim();
@@ -243,6 +263,15 @@ int VecEnv::loadMotionFile(const std::string& path) {
     return motionLibrary_.loadFile(path, *ownedSkeleton_);
 }
 
+int VecEnv::loadMotionFiles(const std::vector<std::string>& paths) {
+    if (!ownedSkeleton_) {
+        SDL_LogError(SDL_LOG_CATEGORY_APPLICATION,
+                     "VecEnv::loadMotionFiles: no skeleton available");
+        return 0;
+    }
+    return motionLibrary_.loadFiles(paths, *ownedSkeleton_);
+}
+
 void VecEnv::resetDoneWithMotions() {
     if (motionLibrary_.empty() || !ownedSkeleton_) {
         // No motions loaded — use default standing pose
@@ -82,10 +82,20 @@ public:
     // Load a single FBX animation file.
     int loadMotionFile(const std::string& path);
 
+    // Load several FBX animation files in one call. Files are read and their
+    // keyframes sampled concurrently; the OpenFBX parse itself is serialized.
+    int loadMotionFiles(const std::vector<std::string>& paths);
+
     // Reset done environments using random frames from the motion library.
     // Falls back to default standing pose if no motions are loaded.
     void resetDoneWithMotions();
 
+    // Step all environments, then reset the ones whose episodes ended using
+    // random motion frames (see resetDoneWithMotions). dones() still reports
+    // this step's terminations, while observations() already holds the first
+    // observation of the new episode for reset environments.
+    void stepWithAutoReset(const float* actions);
+
     // Access the motion library directly.
     const MotionLibrary& motionLibrary() const { return motionLibrary_; }
 
@@ -125,11 +135,17 @@ private:
     // Contiguous output buffers
     // dones_ uses uint8_t because std::vector<bool> is bit-packed and does
     // not provide a contiguous bool* suitable for zero-copy pybind11 access.
+    // They are allocated once and never reallocated or swapped: the Python
+    // bindings hold persistent views (and may page-lock) their data().
     std::vector<float> observations_;
     std::vector<float> ampObservations_;
     std::vector<float> rewards_;
     std::vector<uint8_t> dones_;
 
+    // Scratch holding this step's done flags across the resets in
+    // stepWithAutoReset (resetDoneWithMotions clears dones_).
+    std::vector<uint8_t> terminated_;
+
     // Copy per-env observations into the contiguous output buffers.
     void copyObsToBuffers();
 
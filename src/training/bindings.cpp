@@ -6,6 +6,7 @@
 //   env = jolt_training.VecEnv(num_envs=4096, skeleton_path="data/characters/humanoid.glb")
 //   obs = env.reset()
 //   obs, rewards, dones = env.step(actions)
+//   obs, rewards, dones = env.step_with_autoreset(actions)
 
 #ifdef BUILD_PYTHON_BINDINGS
 
@@ -23,6 +24,61 @@
 
 namespace py = pybind11;
 
+namespace {
+
+// Validate a batched actions array and return a pointer to its data.
+const float* actionsData(const py::array_t<float>& actions) {
+    auto buf = actions.request();
+    if (buf.ndim != 2) {
+        throw std::runtime_error("Actions must be 2D array [num_envs, action_dim]");
+    }
+    return static_cast<const float*>(buf.ptr);
+}
+
+// Zero-copy views into VecEnv's contiguous output buffers. The views keep
+// the env alive and see every later step/reset write in place.
+py::array_t<float> obsView(training::VecEnv& self) {
+    int n = self.numEnvs();
+    int pd = self.policyObsDim();
+    return py::array_t<float>(
+        {n, pd}, {pd * sizeof(float), sizeof(float)},
+        self.observations(), py::cast(self));
+}
+
+py::array_t<float> rewardsView(training::VecEnv& self) {
+    return py::array_t<float>(
+        {self.numEnvs()}, {sizeof(float)},
+        self.rewards(), py::cast(self));
+}
+
+// dones_ is stored as uint8_t 0/1, which has numpy bool's layout
+py::array_t<bool> donesView(training::VecEnv& self) {
+    return py::array_t<bool>(
+        {self.numEnvs()}, {sizeof(bool)},
+        self.dones(), py::cast(self));
+}
+
+// Package the current (obs, rewards, dones) of a VecEnv as numpy arrays.
+py::tuple stepOutputs(training::VecEnv& self) {
+    int n = self.numEnvs();
+
+    // These are views into VecEnv's contiguous buffers — zero copy
+    auto obs = obsView(self);
+    auto rewards = rewardsView(self);
+
+    // Convert bool* to numpy (need copy since numpy bool is 1 byte)
+    auto dones_arr = py::array_t<bool>({n});
+    auto dones_mut = dones_arr.mutable_unchecked<1>();
+    const bool* d = self.dones();
+    for (int i = 0; i < n; ++i) {
+        dones_mut(i) = d[i];
+    }
+
+    return py::make_tuple(obs, rewards, dones_arr);
+}
+
+} // namespace
+
 PYBIND11_MODULE(jolt_training, m) {
     m.doc() = "Jolt Physics training environment for AMP/CALM reinforcement learning";
 
@@ -93,7 +149,10 @@ PYBIND11_MODULE(jolt_training, m) {
             py::arg("config") = training::EnvConfig{})
 
         .def("reset", [](training::VecEnv& self) {
-            self.reset();
+            {
+                py::gil_scoped_release release;
+                self.reset();
+            }
             // Return observations as numpy array
             int n = self.numEnvs();
             int d = self.policyObsDim();
@@ -104,35 +163,46 @@ PYBIND11_MODULE(jolt_training, m) {
         })
 
         .def("step", [](training::VecEnv& self, py::array_t<float> actions) {
-            auto buf = actions.request();
-            if (buf.ndim != 2) {
-                throw std::runtime_error("Actions must be 2D array [num_envs, action_dim]");
+            const float* data = actionsData(actions);
+            {
+                // Physics runs without the GIL so other Python threads
+                // (e.g. the background checkpoint writer) keep running
+                py::gil_scoped_release release;
+                self.step(data);
             }
-            self.step(static_cast<float*>(buf.ptr));
+            return stepOutputs(self);
+        }, py::arg("actions"))
 
-            int n = self.numEnvs();
-            int pd = self.policyObsDim();
-            int ad = self.ampObsDim();
-
-            // Return (obs, rewards, dones) as numpy arrays
-            // These are views into VecEnv's contiguous buffers — zero copy
-            auto obs = py::array_t<float>(
-                {n, pd}, {pd * sizeof(float), sizeof(float)},
-                self.observations(), py::cast(self));
-            auto rewards = py::array_t<float>(
-                {n}, {sizeof(float)},
-                self.rewards(), py::cast(self));
-
-            // Convert bool* to numpy (need copy since numpy bool is 1 byte)
-            auto dones_arr = py::array_t<bool>({n});
-            auto dones_mut = dones_arr.mutable_unchecked<1>();
-            const bool* d = self.dones();
-            for (int i = 0; i < n; ++i) {
-                dones_mut(i) = d[i];
+        .def("step_with_autoreset", [](training::VecEnv& self, py::array_t<float> actions) {
+            const float* data = actionsData(actions);
+            {
+                py::gil_scoped_release release;
+                self.stepWithAutoReset(data);
+            }
+            return stepOutputs(self);
+        }, py::arg("actions"),
+           "Step all envs, then reset done envs from the motion library in the same call. "
+           "dones reports this step's terminations; obs of reset envs are their new initial obs.")
+
+        .def("step_inplace", [](training::VecEnv& self, py::array_t<float> actions,
+                                bool autoreset) {
+            const float* data = actionsData(actions);
+            py::gil_scoped_release release;
+            if (autoreset) {
+                self.stepWithAutoReset(data);
+            } else {
+                self.step(data);
             }
+        }, py::arg("actions"), py::arg("autoreset") = true,
+           "Step all envs without building outputs; read them from obs_view, "
+           "rewards_view and dones_view, which are updated in place.")
 
-            return py::make_tuple(obs, rewards, dones_arr);
-        }, py::arg("actions"))
+        .def_property_readonly("obs_view", &obsView,
+             "Persistent zero-copy view of the observation buffer [num_envs, obs_dim].")
+        .def_property_readonly("rewards_view", &rewardsView,
+             "Persistent zero-copy view of the reward buffer [num_envs].")
+        .def_property_readonly("dones_view", &donesView,
+             "Persistent zero-copy bool view of the done flags [num_envs].")
 
         .def("amp_observations", [](training::VecEnv& self) {
             int n = self.numEnvs();
@@ -150,14 +220,20 @@ PYBIND11_MODULE(jolt_training, m) {
 
         // Motion library: load FBX animations for training
         .def("load_motions", &training::VecEnv::loadMotions,
-             py::arg("directory"),
+             py::arg("directory"), py::call_guard<py::gil_scoped_release>(),
              "Load all FBX animation files from a directory. Returns number of clips loaded.")
 
         .def("load_motion_file", &training::VecEnv::loadMotionFile,
-             py::arg("path"),
+             py::arg("path"), py::call_guard<py::gil_scoped_release>(),
              "Load animations from a single FBX file. Returns number of clips loaded.")
 
+        .def("load_motion_files", &training::VecEnv::loadMotionFiles,
+             py::arg("paths"), py::call_guard<py::gil_scoped_release>(),
+             "Load animations from several FBX files in one call (OpenFBX parsing is serialized). "
+             "Returns number of clips loaded.")
+
         .def("reset_done_with_motions", &training::VecEnv::resetDoneWithMotions,
+             py::call_guard<py::gil_scoped_release>(),
              "Reset done environments using random frames from loaded motion library.")
 
         .def_property_readonly("num_motions", [](const training::VecEnv& self) {
@@ -0,0 +1,64 @@
+"""Numba-compiled GAE recurrence for CPU rollouts.
+
+On the CPU the per-timestep PyTorch loop in RolloutBuffer.compute_returns is
+dominated by op dispatch overhead. This kernel runs the same recurrence as a
+compiled loop over NumPy views that share memory with the buffer tensors.
+
+Requires numba; training.ppo guards the import and falls back to the PyTorch
+implementation when it is not installed.
+"""
+
+import numba
+import numpy as np
+
+# Environments per parallel work item. The buffers are time-major
+# (num_steps, num_envs), so each block walks time backwards while its inner
+# loop reads a contiguous run of envs (unit stride, SIMD-friendly).
+_ENV_BLOCK = 256
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def gae_cpu(
+    rewards: np.ndarray,
+    values: np.ndarray,
+    dones: np.ndarray,
+    last_values: np.ndarray,
+    last_dones: np.ndarray,
+    gamma: float,
+    gae_lambda: float,
+    advantages: np.ndarray,
+    returns: np.ndarray,
+) -> None:
+    """Compute GAE advantages and returns in-place.
+
+    Args:
+        rewards: Rewards, shape (num_steps, num_envs).
+        values: Value estimates, shape (num_steps, num_envs).
+        dones: Done flags, shape (num_steps, num_envs).
+        last_values: Value estimate after the last step, shape (num_envs,).
+        last_dones: Done flags after the last step, shape (num_envs,).
+        gamma: Discount factor.
+        gae_lambda: GAE lambda.
+        advantages: Output advantages, shape (num_steps, num_envs).
+        returns: Output returns, shape (num_steps, num_envs).
+    """
+    num_steps, num_envs = rewards.shape
+    num_blocks = (num_envs + _ENV_BLOCK - 1) // _ENV_BLOCK
+    for b in numba.prange(num_blocks):
+        start = b * _ENV_BLOCK
+        end = min(start + _ENV_BLOCK, num_envs)
+        gae = np.zeros(end - start, dtype=np.float32)
+        for t in range(num_steps - 1, -1, -1):
+            if t == num_steps - 1:
+                next_values = last_values
+                next_dones = last_dones
+            else:
+                next_values = values[t + 1]
+                next_dones = dones[t + 1]
+            for n in range(start, end):
+                k = n - start
+                not_done = 1.0 - next_dones[n]
+                delta = rewards[t, n] + gamma * next_values[n] * not_done - values[t, n]
+                gae[k] = delta + gamma * gae_lambda * not_done * gae[k]
+                advantages[t, n] = gae[k]
+                returns[t, n] = gae[k] + values[t, n]
@@ -0,0 +1,53 @@
+"""Counter-based normal sampling shared by DummyVecEnv's fill paths.
+
+Every output element is a pure function of (seed, stream, element index):
+each pair of elements is drawn with Box-Muller from a SplitMix64 hash of the
+three. training._rng_numba compiles the same recurrence into a parallel
+kernel; this module holds the constants and the NumPy implementation used
+when numba is not installed, so a seed gives the same observation sequence
+either way (up to float rounding in the transcendental functions).
+"""
+
+import numpy as np
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_LOW32 = np.uint64(0xFFFFFFFF)
+_INV_2_32 = 1.0 / 4294967296.0
+
+
+def _splitmix64_np(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    z = x + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def fill_normal_numpy(out: np.ndarray, scale: float, seed: int, stream: int) -> None:
+    """Fill ``out`` in-place with scaled standard normal samples.
+
+    Same generator as training._rng_numba.fill_normal, vectorized with NumPy
+    on a single thread. Allocates temporaries per call.
+
+    Args:
+        out: C-contiguous float32 output array.
+        scale: Standard deviation of the samples.
+        seed: Generator seed.
+        stream: Index of this fill within the seed's sequence.
+    """
+    flat = out.reshape(-1)
+    n = flat.size
+    with np.errstate(over="ignore"):
+        key = _splitmix64_np(
+            np.uint64(seed) ^ _splitmix64_np(np.array(stream, dtype=np.uint64))
+        )
+        pairs = np.arange((n + 1) // 2, dtype=np.uint64)
+        bits = _splitmix64_np(key ^ pairs)
+    u1 = ((bits >> np.uint64(32)).astype(np.float64) + 0.5) * _INV_2_32
+    u2 = (bits & _LOW32).astype(np.float64) * _INV_2_32
+    r = scale * np.sqrt(-2.0 * np.log(u1))
+    theta = 2.0 * np.pi * u2
+    flat[0::2] = r * np.cos(theta)
+    flat[1::2] = (r * np.sin(theta))[: n // 2]
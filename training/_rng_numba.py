@@ -0,0 +1,68 @@
+"""Numba-compiled parallel normal sampling for DummyVecEnv.
+
+NumPy's Generator fills arrays on a single thread, which dominates the dummy
+environment's step once its buffers are reused. This kernel fills a
+preallocated float32 array across all Numba threads and applies the scale in
+the same pass.
+
+Samples come from a counter-based generator: every output element is a pure
+function of (seed, stream, element index), so results are reproducible across
+runs and independent of the thread count or scheduling.
+
+Requires numba; training.vec_env_wrapper imports this module on first use and
+falls back to training._rng.fill_normal_numpy, the same generator in NumPy,
+when numba is not installed.
+"""
+
+import math
+
+import numba
+import numpy as np
+
+from training._rng import _GOLDEN, _INV_2_32, _LOW32, _MIX1, _MIX2
+
+# Element pairs per parallel work item
+_PAIR_BLOCK = 4096
+
+
+@numba.njit(inline="always")
+def _splitmix64(x: np.uint64) -> np.uint64:
+    """SplitMix64 finalizer: a bijective 64-bit hash."""
+    z = x + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def fill_normal(out: np.ndarray, scale: float, seed: int, stream: int) -> None:
+    """Fill ``out`` in-place with scaled standard normal samples.
+
+    Each pair of elements is drawn with Box-Muller from a hash of
+    (seed, stream, pair index). Callers pass a new ``stream`` per fill to get
+    fresh samples.
+
+    Args:
+        out: C-contiguous float32 output array, shape (rows, cols).
+        scale: Standard deviation of the samples.
+        seed: Generator seed.
+        stream: Index of this fill within the seed's sequence.
+    """
+    flat = out.reshape(-1)
+    n = flat.size
+    key = _splitmix64(np.uint64(seed) ^ _splitmix64(np.uint64(stream)))
+    num_pairs = (n + 1) // 2
+    num_blocks = (num_pairs + _PAIR_BLOCK - 1) // _PAIR_BLOCK
+    for b in numba.prange(num_blocks):
+        start = b * _PAIR_BLOCK
+        end = min(start + _PAIR_BLOCK, num_pairs)
+        for k in range(start, end):
+            bits = _splitmix64(key ^ np.uint64(k))
+            u1 = (np.float64(bits >> np.uint64(32)) + 0.5) * _INV_2_32
+            u2 = np.float64(bits & _LOW32) * _INV_2_32
+            r = scale * math.sqrt(-2.0 * math.log(u1))
+            theta = 2.0 * math.pi * u2
+            i = 2 * k
+            flat[i] = r * math.cos(theta)
+            if i + 1 < n:
+                flat[i + 1] = r * math.sin(theta)
@@ -47,6 +47,9 @@ class AMPTrainer:
         device: Torch device for computation.
     """
 
+    # Order of the statistics returned by update_async
+    STAT_NAMES = ("disc_loss", "disc_real_score", "disc_fake_score", "gradient_penalty")
+
     def __init__(
         self,
         discriminator: nn.Module,
@@ -62,7 +65,19 @@ class AMPTrainer:
 
         self.optimizer = torch.optim.Adam(discriminator.parameters(), lr=lr)
 
-    def compute_style_reward(self, amp_obs: torch.Tensor) -> torch.Tensor:
+        # All reference AMP observations, concatenated once on the device so
+        # real samples are drawn with torch.randint instead of host sampling
+        # and a host-to-device copy every update.
+        clip_obs = [clip.amp_observations for clip in motion_dataset.clips]
+        self.reference_obs: Optional[torch.Tensor] = None
+        if clip_obs:
+            all_obs = np.concatenate(clip_obs).astype(np.float32, copy=False)
+            if all_obs.shape[0] > 0:
+                self.reference_obs = torch.from_numpy(all_obs).to(device)
+
+    def compute_style_reward(
+        self, amp_obs: torch.Tensor, out: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
         """Compute AMP style reward from discriminator scores.
 
         Evaluates the discriminator on policy-generated observations and
@@ -77,13 +92,16 @@ class AMPTrainer:
         Args:
             amp_obs: AMP observation tensor from policy rollout,
                 shape (batch, amp_obs_dim).
+            out: Optional preallocated output tensor, shape (batch,).
 
         Returns:
             Style rewards, shape (batch,), values in [0, 1].
         """
         with torch.no_grad():
             scores = self.discriminator(amp_obs).squeeze(-1)
-            reward = torch.clamp(1.0 - 0.25 * (scores - 1.0) ** 2, min=0.0, max=1.0)
+            reward = torch.clamp(
+                1.0 - 0.25 * (scores - 1.0) ** 2, min=0.0, max=1.0, out=out
+            )
         return reward
 
     def _compute_gradient_penalty(
@@ -136,6 +154,26 @@ class AMPTrainer:
         reference_obs: Optional[torch.Tensor] = None,
         reference_batch_size: Optional[int] = None,
     ) -> dict[str, float]:
+        """Train the discriminator and return its statistics as floats.
+
+        Same as update_async, followed by a single host read of the stats.
+
+        Returns:
+            Dict of training statistics keyed by STAT_NAMES:
+                "disc_loss": Total discriminator loss
+                "disc_real_score": Mean discriminator score on real data
+                "disc_fake_score": Mean discriminator score on fake data
+                "gradient_penalty": Gradient penalty value
+        """
+        stats = self.update_async(policy_obs, reference_obs, reference_batch_size)
+        return dict(zip(self.STAT_NAMES, stats.tolist()))
+
+    def update_async(
+        self,
+        policy_obs: torch.Tensor,
+        reference_obs: Optional[torch.Tensor] = None,
+        reference_batch_size: Optional[int] = None,
+    ) -> torch.Tensor:
         """Train the discriminator on real and fake observations.
 
         Uses the WGAN-GP objective:
@@ -149,24 +187,33 @@ class AMPTrainer:
             policy_obs: AMP observations from policy rollout,
                 shape (batch, obs_dim). These are the "fake" samples.
             reference_obs: Reference motion observations. If None, samples
-                from the motion_dataset. Shape (batch, obs_dim).
+                uniformly from the cached reference frames (or the
+                motion_dataset if it has none). Shape (batch, obs_dim).
             reference_batch_size: Number of reference samples to draw if
                 reference_obs is not provided. Defaults to policy_obs batch size.
 
+        Issues no host synchronization, so it can run on a side stream
+        while other work proceeds.
+
         Returns:
-            Dict of training statistics:
-                "disc_loss": Total discriminator loss
-                "disc_real_score": Mean discriminator score on real data
-                "disc_fake_score": Mean discriminator score on fake data
-                "gradient_penalty": Gradient penalty value
+            Detached stats tensor, shape (4,), ordered as STAT_NAMES.
         """
         batch_size = policy_obs.shape[0]
 
         # Get reference observations
         if reference_obs is None:
             ref_batch_size = reference_batch_size or batch_size
-            ref_np = self.motion_dataset.sample_amp_obs(ref_batch_size)
-            reference_obs = torch.from_numpy(ref_np).to(self.device)
+            if self.reference_obs is not None:
+                idx = torch.randint(
+                    0,
+                    self.reference_obs.shape[0],
+                    (ref_batch_size,),
+                    device=self.device,
+                )
+                reference_obs = self.reference_obs[idx]
+            else:
+                ref_np = self.motion_dataset.sample_amp_obs(ref_batch_size)
+                reference_obs = torch.from_numpy(ref_np).to(self.device)
 
         # Ensure same batch size for gradient penalty
         min_batch = min(policy_obs.shape[0], reference_obs.shape[0])
@@ -192,9 +239,6 @@ class AMPTrainer:
         total_loss.backward()
         self.optimizer.step()
 
-        return {
-            "disc_loss": disc_loss.item(),
-            "disc_real_score": real_scores.mean().item(),
-            "disc_fake_score": fake_scores.mean().item(),
-            "gradient_penalty": gp.item(),
-        }
+        return torch.stack(
+            [disc_loss, real_scores.mean(), fake_scores.mean(), gp]
+        ).detach()
@@ -8,12 +8,75 @@ References:
   - Schulman et al., "High-Dimensional Continuous Control Using GAE", 2015
 """
 
-from typing import Optional
+import inspect
+import logging
+from typing import Iterator, Optional
 
 import torch
 import torch.nn as nn
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+# Optional Numba kernel for computing GAE on CPU-resident buffers
+try:
+    from training._gae_numba import gae_cpu
+except ImportError:
+    gae_cpu = None
+
+# Upper bound on page-locked staging memory per RolloutBuffer. Pinned memory
+# is a scarce OS resource; above this the buffer copies directly instead.
+_MAX_PINNED_STAGING_BYTES = 1536 * 1024 * 1024
+
+# Storage tensors filled per step by RolloutBuffer.add
+_STEP_FIELDS = ("observations", "actions", "log_probs", "rewards", "dones", "values")
+
+# Per-step float32 scalars stored field-major: log_probs, rewards, dones,
+# values, then the computed returns and advantages
+_NUM_SCALARS = 6
+
+
+def _ppo_losses(
+    new_log_probs: torch.Tensor,
+    old_log_probs: torch.Tensor,
+    advantages: torch.Tensor,
+    new_values: torch.Tensor,
+    returns: torch.Tensor,
+    entropy: torch.Tensor,
+    clip_epsilon: float,
+    value_coeff: float,
+    entropy_coeff: float,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """PPO-Clip objective for one mini-batch.
+
+    Kept free of Python control flow so ``torch.compile`` can fuse the chain
+    of small elementwise ops into a few kernels.
+
+    Returns:
+        Tuple of (loss, policy_loss, value_loss, entropy_mean, approx_kl).
+    """
+    # Policy loss: PPO-Clip
+    log_ratio = new_log_probs - old_log_probs
+    ratio = torch.exp(log_ratio)
+    surr1 = ratio * advantages
+    surr2 = torch.clamp(ratio, 1.0 - clip_epsilon, 1.0 + clip_epsilon) * advantages
+    policy_loss = -torch.min(surr1, surr2).mean()
+
+    # Value loss: clipped MSE
+    value_loss = nn.functional.mse_loss(new_values, returns)
+
+    # Entropy bonus
+    entropy_mean = entropy.mean()
+
+    # Total loss
+    loss = policy_loss + value_coeff * value_loss - entropy_coeff * entropy_mean
+
+    # Approximate KL divergence (Schulman's k3 estimator); log(ratio) is
+    # log_ratio, so there is no need to take the log again
+    approx_kl = ((ratio - 1.0) - log_ratio).mean()
+
+    return loss, policy_loss, value_loss, entropy_mean, approx_kl
+
 
 class RolloutBuffer:
     """Stores rollout data from vectorized environments for PPO training.
@@ -22,12 +85,24 @@ class RolloutBuffer:
     and value estimates for N steps from M parallel environments. After
     collection, computes GAE-based returns and advantages for the PPO update.
 
+    All per-step fields are views into two preallocated tensors (a tile of
+    network inputs and a field-major block of float32 scalars), and the
+    ``flat_*`` attributes are views over those, so storage must be updated
+    in-place rather than reassigned.
+
     Args:
         num_steps: Number of environment steps to collect per rollout.
         num_envs: Number of parallel environments.
         obs_dim: Dimension of the observation vector.
         action_dim: Dimension of the action vector.
         device: Torch device for tensor storage.
+        storage_dtype: Dtype for observations, actions and latents. These are
+            only ever network inputs, so bfloat16 halves their memory and
+            gather bandwidth; they are upcast to float32 when gathered. Scalar
+            fields (log probs, rewards, values, ...) always stay float32.
+        preshuffle: If True, permute the rollout into a shuffled copy once per
+            epoch so every mini-batch is a contiguous slice (doubles the memory
+            of the batched fields). If False, gather each mini-batch on demand.
     """
 
     def __init__(
@@ -37,6 +112,8 @@ class RolloutBuffer:
         obs_dim: int,
         action_dim: int,
         device: torch.device = torch.device("cpu"),
+        storage_dtype: torch.dtype = torch.float32,
+        preshuffle: bool = False,
     ):
         self.num_steps = num_steps
         self.num_envs = num_envs
@@ -44,54 +121,132 @@ class RolloutBuffer:
         self.action_dim = action_dim
         self.device = device
 
-        # Pre-allocate storage tensors
-        self.observations = torch.zeros(
-            (num_steps, num_envs, obs_dim), dtype=torch.float32, device=device
-        )
-        self.actions = torch.zeros(
-            (num_steps, num_envs, action_dim), dtype=torch.float32, device=device
-        )
-        self.log_probs = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
-        )
-        self.rewards = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
-        )
-        self.dones = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
-        )
-        self.values = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
+        if (
+            storage_dtype == torch.bfloat16
+            and device.type == "cuda"
+            and not torch.cuda.is_bf16_supported()
+        ):
+            logger.warning(
+                "bfloat16 rollout storage not supported on %s; using float32",
+                device,
+            )
+            storage_dtype = torch.float32
+        self.storage_dtype = storage_dtype
+
+        # Network inputs live in one (num_steps, num_envs, per_step) tile,
+        # [obs | actions | latents], so each add() writes them into a single
+        # contiguous row block
+        self.latent_dim = 0
+        self._storage = torch.zeros(
+            (num_steps, num_envs, obs_dim + action_dim),
+            dtype=storage_dtype,
+            device=device,
         )
 
-        # Computed after rollout
-        self.returns = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
-        )
-        self.advantages = torch.zeros(
-            (num_steps, num_envs), dtype=torch.float32, device=device
-        )
+        # Scalar fields share one field-major (field, num_steps, num_envs)
+        # allocation, so each field stays a contiguous, unit-stride
+        # (num_steps, num_envs) block for the GAE pass. The returns and
+        # advantages are computed after the rollout.
+        (
+            self.log_probs,
+            self.rewards,
+            self.dones,
+            self.values,
+            self.returns,
+            self.advantages,
+        ) = torch.zeros(
+            (_NUM_SCALARS, num_steps, num_envs), dtype=torch.float32, device=device
+        ).unbind(0)
 
         # Optional: latent codes for CALM/HLC training
         self.latents: Optional[torch.Tensor] = None
+        self.flat_latents: Optional[torch.Tensor] = None
+
+        self._bind_views()
+
+        total_samples = num_steps * num_envs
+        self.flat_returns = self.returns.view(total_samples)
+        self.flat_advantages = self.advantages.view(total_samples)
+
+        # Reused shuffle index buffer, regenerated in-place every epoch
+        self._perm = torch.empty(total_samples, dtype=torch.long, device=device)
+
+        # Shuffled copies of the batched fields, allocated on first use
+        self.preshuffle = preshuffle
+        self._shuffled: dict[str, torch.Tensor] = {}
+
+        # Pinned host mirrors for CPU-produced data stored on CUDA. Inputs are
+        # staged into page-locked memory and transferred with non_blocking
+        # copies that overlap the next environment step. Each step has its
+        # own slot, so a slot is only rewritten after a full rollout. Pinned
+        # memory is scarce, so a field's mirror (and the copy stream) is only
+        # allocated the first time a CPU tensor is added to it; device-side
+        # rollouts never pay for them.
+        self._staging: dict[str, torch.Tensor] = {}
+        staging_bytes = sum(getattr(self, name).nbytes for name in _STEP_FIELDS)
+        self._staging_enabled = (
+            device.type == "cuda" and staging_bytes <= _MAX_PINNED_STAGING_BYTES
+        )
+
+        # Staged host-to-device copies run on the buffer's own stream so they
+        # never queue behind compute
+        self._copy_stream: Optional[torch.cuda.Stream] = None
 
         self.step = 0
 
     def reset(self) -> None:
         """Reset the buffer for a new rollout collection."""
         self.step = 0
+        if self._copy_stream is not None:
+            # New writes must not overtake earlier readers of this storage
+            self._copy_stream.wait_stream(torch.cuda.current_stream(self.device))
+
+    def _bind_views(self) -> None:
+        """(Re)bind the input field views into the storage tile.
+
+        The observation, action and latent views are strided slices of the
+        last dimension; their (num_steps, num_envs) dims still merge, so the
+        ``flat_*`` views are zero-copy and stay valid as long as storage is
+        written in-place. The scalar fields are contiguous and bound once.
+        """
+        obs_end = self.obs_dim
+        act_end = obs_end + self.action_dim
+
+        self.observations = self._storage[..., :obs_end]
+        self.actions = self._storage[..., obs_end:act_end]
+        if self.latent_dim:
+            self.latents = self._storage[..., -self.latent_dim :]
+
+        # Flat (num_steps * num_envs, ...) views used for mini-batch gathers
+        total_samples = self.num_steps * self.num_envs
+        self.flat_observations = self.observations.view(total_samples, self.obs_dim)
+        self.flat_actions = self.actions.view(total_samples, self.action_dim)
+        self.flat_log_probs = self.log_probs.view(total_samples)
+        self.flat_values = self.values.view(total_samples)
+        if self.latents is not None:
+            self.flat_latents = self.latents.view(total_samples, self.latent_dim)
 
     def enable_latent_storage(self, latent_dim: int) -> None:
         """Enable storage for latent codes (used in CALM/HLC modes).
 
+        Appends the latent columns to the storage tile, so all field views
+        are rebound; references taken before this call are stale.
+
         Args:
             latent_dim: Dimension of the latent code vector.
         """
-        self.latents = torch.zeros(
-            (self.num_steps, self.num_envs, latent_dim),
-            dtype=torch.float32,
-            device=self.device,
+        self._storage = torch.cat(
+            [
+                self._storage,
+                self._storage.new_zeros(
+                    (self.num_steps, self.num_envs, latent_dim)
+                ),
+            ],
+            dim=-1,
         )
+        self.latent_dim = latent_dim
+        self._shuffled.clear()
+        self._bind_views()
 
     def add(
         self,
@@ -113,22 +268,48 @@ class RolloutBuffer:
             dones: Episode termination flags, shape (num_envs,).
             values: Value estimates, shape (num_envs,).
             latents: Optional latent codes, shape (num_envs, latent_dim).
-        """
-        assert self.step < self.num_steps, (
-            f"Buffer is full: step {self.step} >= num_steps {self.num_steps}"
-        )
 
-        self.observations[self.step] = obs
-        self.actions[self.step] = actions
-        self.log_probs[self.step] = log_probs
-        self.rewards[self.step] = rewards
-        self.dones[self.step] = dones
-        self.values[self.step] = values
+        Raises:
+            IndexError: If the buffer already holds num_steps timesteps.
+        """
+        for name, value in zip(
+            _STEP_FIELDS, (obs, actions, log_probs, rewards, dones, values)
+        ):
+            self._copy_in(name, value)
 
         if latents is not None and self.latents is not None:
             self.latents[self.step] = latents
 
         self.step += 1
+        if self.step == self.num_steps and self._copy_stream is not None:
+            # Rollout complete: order all later compute after the copies
+            torch.cuda.current_stream(self.device).wait_stream(self._copy_stream)
+
+    def _copy_in(self, name: str, value: torch.Tensor) -> None:
+        """Write one timestep of data into the storage tensor ``name``."""
+        target = getattr(self, name)[self.step]
+        if self._staging_enabled and not value.is_cuda:
+            staging = self._staging.get(name)
+            if staging is None:
+                staging = self._allocate_staging(name)
+            staged = staging[self.step]
+            staged.copy_(value)
+            with torch.cuda.stream(self._copy_stream):
+                target.copy_(staged, non_blocking=True)
+        else:
+            target.copy_(value)
+
+    def _allocate_staging(self, name: str) -> torch.Tensor:
+        """Allocate the pinned mirror of ``name`` (and the copy stream)."""
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(self.device)
+            # Earlier writes to the storage were issued on the current stream
+            self._copy_stream.wait_stream(torch.cuda.current_stream(self.device))
+        storage = getattr(self, name)
+        staging = self._staging[name] = torch.empty(
+            storage.shape, dtype=storage.dtype, pin_memory=True
+        )
+        return staging
 
     def compute_returns(
         self,
@@ -150,88 +331,112 @@ class RolloutBuffer:
             gamma: Discount factor.
             gae_lambda: GAE lambda for advantage estimation.
         """
-        gae = torch.zeros(self.num_envs, dtype=torch.float32, device=self.device)
-        next_values = last_values
-        next_dones = last_dones
-
-        for t in reversed(range(self.num_steps)):
-            # TD residual: delta = r_t + gamma * V(s_{t+1}) * (1 - done) - V(s_t)
-            delta = (
-                self.rewards[t]
-                + gamma * next_values * (1.0 - next_dones)
-                - self.values[t]
+        # Both paths write into the storage in-place, so the bootstrap
+        # tensors (e.g. bool dones, grad-tracking values) are detached and
+        # cast to the storage dtypes up front
+        last_values = last_values.detach().to(self.values.dtype)
+        last_dones = last_dones.detach().to(self.dones.dtype)
+
+        if gae_cpu is not None and self.device.type == "cpu":
+            # Compiled recurrence over NumPy views sharing the tensor storage
+            gae_cpu(
+                self.rewards.numpy(),
+                self.values.numpy(),
+                self.dones.numpy(),
+                last_values.numpy(),
+                last_dones.numpy(),
+                gamma,
+                gae_lambda,
+                self.advantages.numpy(),
+                self.returns.numpy(),
+            )
+            return
+
+        # Shift by one step so index t holds V(s_{t+1}) and done_{t+1}
+        next_values = torch.cat([self.values[1:], last_values[None]], dim=0)
+        not_dones = torch.cat([self.dones[1:], last_dones[None]], dim=0)
+        not_dones.neg_().add_(1.0)
+
+        # TD residuals for all steps: delta = r_t + gamma * V(s_{t+1}) * (1 - done) - V(s_t)
+        deltas = next_values.mul_(not_dones).mul_(gamma).add_(self.rewards)
+        deltas.sub_(self.values)
+
+        # GAE: A_t = delta_t + gamma * lambda * (1 - done) * A_{t+1}, written
+        # straight into the advantages storage without per-step temporaries
+        discounts = not_dones.mul_(gamma * gae_lambda)
+        self.advantages[-1].copy_(deltas[-1])
+        for t in reversed(range(self.num_steps - 1)):
+            torch.addcmul(
+                deltas[t],
+                discounts[t],
+                self.advantages[t + 1],
+                out=self.advantages[t],
             )
-            # GAE: A_t = delta_t + gamma * lambda * (1 - done) * A_{t+1}
-            gae = delta + gamma * gae_lambda * (1.0 - next_dones) * gae
-            self.advantages[t] = gae
-            self.returns[t] = gae + self.values[t]
 
-            next_values = self.values[t]
-            next_dones = self.dones[t]
+        torch.add(self.advantages, self.values, out=self.returns)
 
-    def get_batches(
-        self, batch_size: int
-    ) -> list[dict[str, torch.Tensor]]:
-        """Generate randomized mini-batches from the rollout data.
+    def get_batches(self, batch_size: int) -> Iterator[dict[str, torch.Tensor]]:
+        """Yield randomized mini-batches from the flat rollout data.
 
-        Flattens the (num_steps, num_envs) data into a single dimension and
-        yields randomly shuffled mini-batches for the PPO update.
+        Normalizes the advantages in-place, then shuffles a reused permutation
+        buffer. With preshuffle, each field is permuted into its shuffled copy
+        with a single index_select and mini-batches are contiguous slices of
+        it; otherwise each mini-batch is gathered when it is requested.
 
         Args:
-            batch_size: Number of samples per mini-batch.
+            batch_size: Number of samples per mini-batch. If it covers the
+                whole rollout, a single unshuffled batch of the flat views is
+                yielded with no copy.
 
-        Returns:
-            List of dicts, each containing:
+        Yields:
+            Dicts containing:
                 "obs": (batch_size, obs_dim)
                 "actions": (batch_size, action_dim)
                 "log_probs": (batch_size,)
                 "returns": (batch_size,)
                 "advantages": (batch_size,)
-                "values": (batch_size,)
                 "latents": (batch_size, latent_dim) [if latents enabled]
         """
         total_samples = self.num_steps * self.num_envs
 
-        # Flatten all data from (steps, envs, ...) to (steps * envs, ...)
-        flat_obs = self.observations[: self.num_steps].reshape(total_samples, -1)
-        flat_actions = self.actions[: self.num_steps].reshape(total_samples, -1)
-        flat_log_probs = self.log_probs[: self.num_steps].reshape(total_samples)
-        flat_returns = self.returns[: self.num_steps].reshape(total_samples)
-        flat_advantages = self.advantages[: self.num_steps].reshape(total_samples)
-        flat_values = self.values[: self.num_steps].reshape(total_samples)
+        # Normalize advantages in-place
+        adv = self.flat_advantages
+        adv.sub_(adv.mean()).div_(adv.std().add_(1e-8))
 
-        flat_latents = None
-        if self.latents is not None:
-            flat_latents = self.latents[: self.num_steps].reshape(total_samples, -1)
+        fields = {
+            "obs": self.flat_observations,
+            "actions": self.flat_actions,
+            "log_probs": self.flat_log_probs,
+            "returns": self.flat_returns,
+            "advantages": self.flat_advantages,
+        }
+        if self.flat_latents is not None:
+            fields["latents"] = self.flat_latents
 
-        # Normalize advantages
-        adv_mean = flat_advantages.mean()
-        adv_std = flat_advantages.std() + 1e-8
-        flat_advantages = (flat_advantages - adv_mean) / adv_std
+        if batch_size >= total_samples:
+            yield fields
+            return
 
         # Random permutation
-        indices = torch.randperm(total_samples, device=self.device)
-        batches = []
-
-        for start in range(0, total_samples, batch_size):
-            end = min(start + batch_size, total_samples)
-            batch_indices = indices[start:end]
-
-            batch = {
-                "obs": flat_obs[batch_indices],
-                "actions": flat_actions[batch_indices],
-                "log_probs": flat_log_probs[batch_indices],
-                "returns": flat_returns[batch_indices],
-                "advantages": flat_advantages[batch_indices],
-                "values": flat_values[batch_indices],
-            }
-
-            if flat_latents is not None:
-                batch["latents"] = flat_latents[batch_indices]
-
-            batches.append(batch)
-
-        return batches
+        torch.randperm(total_samples, out=self._perm)
+
+        if self.preshuffle:
+            for name, flat in fields.items():
+                shuffled = self._shuffled.get(name)
+                if shuffled is None:
+                    shuffled = self._shuffled[name] = flat.new_empty(flat.shape)
+                torch.index_select(flat, 0, self._perm, out=shuffled)
+            for start in range(0, total_samples, batch_size):
+                yield {
+                    name: self._shuffled[name][start : start + batch_size]
+                    for name in fields
+                }
+        else:
+            for start in range(0, total_samples, batch_size):
+                idx = self._perm[start : start + batch_size]
+                yield {
+                    name: flat.index_select(0, idx) for name, flat in fields.items()
+                }
 
 
 class PPOTrainer:
@@ -249,6 +454,11 @@ class PPOTrainer:
         value_coeff: Coefficient for the value function loss.
         max_grad_norm: Maximum gradient norm for clipping.
         num_update_epochs: Number of PPO optimization epochs per rollout.
+        compile_loss: If True, fuse the loss computation with torch.compile.
+        full_batch_forward: If True, ignore the mini-batch size and run one
+            forward/backward pass over the entire rollout per epoch. For small
+            rollouts this replaces many tiny kernel launches with a few large
+            ones, at the cost of one optimizer step per epoch.
     """
 
     def __init__(
@@ -261,6 +471,8 @@ class PPOTrainer:
         value_coeff: float = 0.5,
         max_grad_norm: float = 1.0,
         num_update_epochs: int = 4,
+        compile_loss: bool = False,
+        full_batch_forward: bool = False,
     ):
         self.policy = policy
         self.value_net = value_net
@@ -269,13 +481,121 @@ class PPOTrainer:
         self.value_coeff = value_coeff
         self.max_grad_norm = max_grad_norm
         self.num_update_epochs = num_update_epochs
+        self.full_batch_forward = full_batch_forward
+
+        self._losses = _ppo_losses
+        if compile_loss:
+            self._losses = torch.compile(
+                _ppo_losses, mode="reduce-overhead", fullgraph=True
+            )
+
+        # Combine parameters from both networks into a single optimizer. The
+        # list is cached because gradient clipping needs it every mini-batch.
+        self._all_params = list(policy.parameters()) + list(value_net.parameters())
+
+        # Fused Adam updates every parameter in one kernel on CUDA; elsewhere
+        # use the multi-tensor (foreach) implementation.
+        on_cuda = all(p.is_cuda for p in self._all_params)
+        if on_cuda:
+            optim_kwargs = {"fused": True}
+        else:
+            optim_kwargs = {"foreach": True}
+        self.optimizer = torch.optim.Adam(self._all_params, lr=lr, **optim_kwargs)
+
+        # Older PyTorch has no foreach argument for gradient clipping
+        self._clip_kwargs: dict[str, bool] = {}
+        if "foreach" in inspect.signature(nn.utils.clip_grad_norm_).parameters:
+            self._clip_kwargs = {"error_if_nonfinite": False, "foreach": True}
+
+        # Policies that share a trunk with the value function can expose
+        # combined_forward(obs, actions, latents) -> (log_probs, entropy, values)
+        # so a mini-batch needs only one forward pass.
+        self._combined_forward = getattr(policy, "combined_forward", None)
+
+        # Resolve how to recompute log probs and entropy once, rather than
+        # probing the policy with hasattr every mini-batch
+        if hasattr(policy, "evaluate_actions"):
+            self._evaluate_policy = self._evaluate_llc
+            self._z_zeros_cache: Optional[torch.Tensor] = None
+        else:
+            self._evaluate_policy = self._evaluate_hlc
+
+        # Independent policy/value networks run their forwards on separate
+        # CUDA streams so small mini-batches can overlap on the GPU.
+        self._policy_stream: Optional[torch.cuda.Stream] = None
+        self._value_stream: Optional[torch.cuda.Stream] = None
+        if on_cuda and self._combined_forward is None:
+            self._policy_stream = torch.cuda.Stream()
+            self._value_stream = torch.cuda.Stream()
+
+    def _evaluate_llc(
+        self,
+        obs: torch.Tensor,
+        actions: torch.Tensor,
+        latents: Optional[torch.Tensor],
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """LLCPolicy: evaluate_actions(z, obs, actions)."""
+        if latents is None:
+            # AMP mode: no stored latents, z=0. The zeros are never written,
+            # so one cached buffer is sliced for every mini-batch.
+            batch = obs.shape[0]
+            cache = self._z_zeros_cache
+            if cache is None or cache.shape[0] < batch:
+                cache = self._z_zeros_cache = torch.zeros(
+                    batch, self.policy.latent_dim, device=obs.device
+                )
+            latents = cache[:batch]
+        return self.policy.evaluate_actions(latents, obs, actions)
+
+    def _evaluate_hlc(
+        self,
+        obs: torch.Tensor,
+        actions: torch.Tensor,
+        latents: Optional[torch.Tensor],
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """HLCPolicy: evaluate_latent(task_obs, z=actions)."""
+        return self.policy.evaluate_latent(obs, actions)
+
+    def _clip_gradients(self) -> None:
+        """Clip the global gradient norm of all trained parameters.
 
-        # Combine parameters from both networks into a single optimizer
-        self.optimizer = torch.optim.Adam(
-            list(policy.parameters()) + list(value_net.parameters()),
-            lr=lr,
+        Uses the multi-tensor norm kernel and skips the non-finite check, so
+        clipping stays on-device with no host sync.
+        """
+        nn.utils.clip_grad_norm_(
+            self._all_params, self.max_grad_norm, **self._clip_kwargs
         )
 
+    def _forward(
+        self,
+        obs: torch.Tensor,
+        actions: torch.Tensor,
+        latents: Optional[torch.Tensor],
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Evaluate policy and value networks on a mini-batch.
+
+        Returns:
+            Tuple of (log_probs, entropy, values), each shape (batch,).
+        """
+        if self._combined_forward is not None:
+            return self._combined_forward(obs, actions, latents)
+
+        if self._policy_stream is None:
+            new_log_probs, entropy = self._evaluate_policy(obs, actions, latents)
+            new_values = self.value_net(obs).squeeze(-1)
+            return new_log_probs, entropy, new_values
+
+        current = torch.cuda.current_stream()
+        self._policy_stream.wait_stream(current)
+        self._value_stream.wait_stream(current)
+        with torch.cuda.stream(self._policy_stream):
+            new_log_probs, entropy = self._evaluate_policy(obs, actions, latents)
+        with torch.cuda.stream(self._value_stream):
+            new_values = self.value_net(obs).squeeze(-1)
+        current.wait_stream(self._policy_stream)
+        current.wait_stream(self._value_stream)
+        return new_log_probs, entropy, new_values
+
     def update(
         self,
         buffer: RolloutBuffer,
@@ -284,7 +604,8 @@ class PPOTrainer:
         """Run PPO update epochs on the collected rollout data.
 
         For each epoch, generates randomized mini-batches and performs one
-        gradient step per batch using the PPO-Clip objective.
+        gradient step per batch using the PPO-Clip objective. With
+        full_batch_forward, each epoch is a single step over the whole rollout.
 
         Args:
             buffer: Filled RolloutBuffer with computed returns and advantages.
@@ -297,85 +618,53 @@ class PPOTrainer:
                 "entropy": Mean policy entropy
                 "approx_kl": Approximate KL divergence between old and new policy
         """
-        total_policy_loss = 0.0
-        total_value_loss = 0.0
-        total_entropy = 0.0
-        total_approx_kl = 0.0
+        # Running sums of (policy_loss, value_loss, entropy, approx_kl), kept
+        # on-device so the loop never blocks on a GPU -> CPU sync
+        stat_sums = torch.zeros(4, device=self._all_params[0].device)
         num_updates = 0
 
-        for _epoch in range(self.num_update_epochs):
-            batches = buffer.get_batches(batch_size)
+        if self.full_batch_forward:
+            batch_size = buffer.num_steps * buffer.num_envs
 
-            for batch in batches:
-                obs = batch["obs"]
-                actions = batch["actions"]
+        for _epoch in range(self.num_update_epochs):
+            for batch in buffer.get_batches(batch_size):
+                obs = batch["obs"].float()
+                actions = batch["actions"].float()
                 old_log_probs = batch["log_probs"]
                 returns = batch["returns"]
                 advantages = batch["advantages"]
-
-                # Recompute log probs and entropy under the current policy
                 latents = batch.get("latents")
-                if latents is not None and hasattr(self.policy, "evaluate_actions"):
-                    # LLCPolicy: evaluate_actions(z, obs, actions)
-                    new_log_probs, entropy = self.policy.evaluate_actions(
-                        latents, obs, actions
-                    )
-                elif hasattr(self.policy, "evaluate_latent"):
-                    # HLCPolicy: evaluate_latent(task_obs, z=actions)
-                    new_log_probs, entropy = self.policy.evaluate_latent(
-                        obs, actions
-                    )
-                else:
-                    # Fallback: LLCPolicy without latents (AMP mode, z=0)
-                    z_zeros = torch.zeros(
-                        obs.shape[0],
-                        self.policy.latent_dim,
-                        device=obs.device,
-                    )
-                    new_log_probs, entropy = self.policy.evaluate_actions(
-                        z_zeros, obs, actions
-                    )
+                if latents is not None:
+                    latents = latents.float()
 
-                # Policy loss: PPO-Clip
-                ratio = torch.exp(new_log_probs - old_log_probs)
-                surr1 = ratio * advantages
-                surr2 = (
-                    torch.clamp(ratio, 1.0 - self.clip_epsilon, 1.0 + self.clip_epsilon)
-                    * advantages
+                new_log_probs, entropy, new_values = self._forward(
+                    obs, actions, latents
                 )
-                policy_loss = -torch.min(surr1, surr2).mean()
-
-                # Value loss: clipped MSE
-                new_values = self.value_net(obs).squeeze(-1)
-                value_loss = nn.functional.mse_loss(new_values, returns)
-
-                # Entropy bonus
-                entropy_mean = entropy.mean()
 
-                # Total loss
-                loss = (
-                    policy_loss
-                    + self.value_coeff * value_loss
-                    - self.entropy_coeff * entropy_mean
+                loss, policy_loss, value_loss, entropy_mean, approx_kl = (
+                    self._losses(
+                        new_log_probs,
+                        old_log_probs,
+                        advantages,
+                        new_values,
+                        returns,
+                        entropy,
+                        self.clip_epsilon,
+                        self.value_coeff,
+                        self.entropy_coeff,
+                    )
                 )
 
                 # Optimize
-                self.optimizer.zero_grad()
+                self.optimizer.zero_grad(set_to_none=True)
                 loss.backward()
-                nn.utils.clip_grad_norm_(
-                    list(self.policy.parameters()) + list(self.value_net.parameters()),
-                    self.max_grad_norm,
-                )
+                self._clip_gradients()
                 self.optimizer.step()
 
-                # Approximate KL divergence
                 with torch.no_grad():
-                    approx_kl = ((ratio - 1.0) - torch.log(ratio)).mean().item()
-
-                total_policy_loss += policy_loss.item()
-                total_value_loss += value_loss.item()
-                total_entropy += entropy_mean.item()
-                total_approx_kl += approx_kl
+                    stat_sums += torch.stack(
+                        [policy_loss, value_loss, entropy_mean, approx_kl]
+                    )
                 num_updates += 1
 
         if num_updates == 0:
@@ -386,9 +675,14 @@ class PPOTrainer:
                 "approx_kl": 0.0,
             }
 
+        # Single sync for all statistics
+        policy_loss, value_loss, entropy, approx_kl = (
+            stat_sums / num_updates
+        ).tolist()
+
         return {
-            "policy_loss": total_policy_loss / num_updates,
-            "value_loss": total_value_loss / num_updates,
-            "entropy": total_entropy / num_updates,
-            "approx_kl": total_approx_kl / num_updates,
+            "policy_loss": policy_loss,
+            "value_loss": value_loss,
+            "entropy": entropy,
+            "approx_kl": approx_kl,
         }
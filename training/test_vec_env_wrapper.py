@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Tests for VecEnvWrapper, DummyVecEnv and the C++ VecEnv output views.
+
+Tests:
+1. DummyVecEnv.step reuses its output buffers and reports bool dones, with
+   episode infos only for the envs that terminate
+2. reset() and reset_tensor() both restart episodes for both APIs
+3. DummyVecEnv.step_tensor/reset_tensor on CPU: dtypes, buffer reuse,
+   obs_out and caller-owned observations
+4. DummyVecEnv observations do not depend on whether numba is installed
+5. VecEnvWrapper.step returns the backend's reused arrays, while
+   step_tensor/reset_tensor return tensors the caller owns
+6. dones_view tracks the done flags across repeated auto-resets, i.e. the
+   persistent view (which VecEnvWrapper reads and page-locks) never goes
+   stale when done envs are reset
+
+The C++ test needs the compiled jolt_training module and a skeleton .glb
+(override with JOLT_TRAINING_SKELETON); it is skipped otherwise.
+
+Usage:
+    python -m pytest training/test_vec_env_wrapper.py
+"""
+
+import os
+
+import numpy as np
+import pytest
+import torch
+
+from training import vec_env_wrapper
+from training._rng import fill_normal_numpy
+from training.vec_env_wrapper import DummyVecEnv, VecEnvWrapper
+
+NUM_ENVS = 4
+OBS_DIM = 8
+ACTION_DIM = 3
+# Short episodes so every env terminates (and auto-resets) every few steps
+MAX_EPISODE_STEPS = 2
+
+_SKELETON_PATH = os.environ.get(
+    "JOLT_TRAINING_SKELETON",
+    os.path.join(
+        os.path.dirname(__file__), "..", "assets", "characters", "player.glb"
+    ),
+)
+
+
+def _make_dummy_env() -> DummyVecEnv:
+    return DummyVecEnv(
+        num_envs=NUM_ENVS,
+        obs_dim=OBS_DIM,
+        action_dim=ACTION_DIM,
+        episode_length=MAX_EPISODE_STEPS,
+    )
+
+
+def _zero_actions() -> np.ndarray:
+    return np.zeros((NUM_ENVS, ACTION_DIM), dtype=np.float32)
+
+
+def test_dummy_step_reuses_buffers():
+    """step() returns the same arrays every call, with bool dones."""
+    env = _make_dummy_env()
+    obs0 = env.reset()
+    obs1, rewards1, dones1, infos1 = env.step(_zero_actions())
+    obs2, rewards2, dones2, infos2 = env.step(_zero_actions())
+
+    assert obs1 is obs0 and obs2 is obs1
+    assert rewards2 is rewards1
+    assert dones2 is dones1
+    assert obs1.shape == (NUM_ENVS, OBS_DIM) and obs1.dtype == np.float32
+    assert rewards1.shape == (NUM_ENVS,) and rewards1.dtype == np.float32
+    assert dones1.dtype == np.bool_
+
+    # Every env terminates on the second step and reports its episode
+    assert dones2.all()
+    for info in infos2:
+        assert info["episode"]["l"] == MAX_EPISODE_STEPS
+        assert isinstance(info["episode"]["r"], float)
+
+
+def test_dummy_infos_only_for_terminated_envs():
+    """Non-terminated envs share the empty info dict."""
+    env = _make_dummy_env()
+    env.reset()
+    _, _, dones, infos = env.step(_zero_actions())
+
+    assert not dones.any()
+    assert len(infos) == NUM_ENVS
+    assert all(info == {} for info in infos)
+
+
+@pytest.mark.parametrize("reset_name", ["reset", "reset_tensor"])
+def test_dummy_resets_restart_both_apis(reset_name):
+    """Either reset restarts episode lengths for step and step_tensor."""
+    env = _make_dummy_env()
+    env.reset()
+    env.reset_tensor()
+    env.step(_zero_actions())
+    env.step_tensor(torch.zeros(NUM_ENVS, ACTION_DIM))
+
+    getattr(env, reset_name)()
+
+    _, _, dones, _ = env.step(_zero_actions())
+    _, _, dones_t, _ = env.step_tensor(torch.zeros(NUM_ENVS, ACTION_DIM))
+    assert not dones.any()
+    assert not dones_t.any()
+
+
+def test_dummy_step_tensor_cpu():
+    """step_tensor on CPU reuses float32 buffers and honours obs_out."""
+    env = _make_dummy_env()
+    obs = env.reset_tensor()
+    assert obs.shape == (NUM_ENVS, OBS_DIM) and obs.dtype == torch.float32
+
+    actions = torch.zeros(NUM_ENVS, ACTION_DIM)
+    obs1, rewards1, dones1, infos1 = env.step_tensor(actions)
+    obs2, rewards2, dones2, _ = env.step_tensor(actions)
+
+    assert rewards2 is rewards1 and dones2 is dones1
+    assert rewards1.shape == (NUM_ENVS,) and rewards1.dtype == torch.float32
+    assert dones1.dtype == torch.float32
+    torch.testing.assert_close(dones2, torch.ones(NUM_ENVS))
+    assert len(infos1) == NUM_ENVS
+
+    obs_out = torch.empty(NUM_ENVS, OBS_DIM)
+    obs3, _, dones3, _ = env.step_tensor(actions, obs_out=obs_out)
+    assert obs3 is obs_out
+    torch.testing.assert_close(dones3, torch.zeros(NUM_ENVS))
+
+
+def test_dummy_step_tensor_returns_owned_obs():
+    """Without obs_out, a later step must not overwrite an earlier obs."""
+    env = _make_dummy_env()
+    env.reset_tensor()
+    actions = torch.zeros(NUM_ENVS, ACTION_DIM)
+    obs1, _, _, _ = env.step_tensor(actions)
+    obs1_before = obs1.clone()
+    obs2, _, _, _ = env.step_tensor(actions)
+
+    assert obs2 is not obs1
+    torch.testing.assert_close(obs1, obs1_before)
+
+
+def test_dummy_obs_independent_of_numba(monkeypatch):
+    """A seed gives the same observations with and without numba."""
+    rng_numba = pytest.importorskip("training._rng_numba")
+
+    sequences = []
+    for fill in (rng_numba.fill_normal, fill_normal_numpy):
+        monkeypatch.setattr(vec_env_wrapper, "_fill_normal", fill)
+        env = _make_dummy_env()
+        obs = [env.reset().copy()]
+        obs += [env.step(_zero_actions())[0].copy() for _ in range(3)]
+        sequences.append(np.stack(obs))
+
+    np.testing.assert_array_equal(sequences[0], sequences[1])
+
+
+def test_wrapper_step_copy_semantics():
+    """step returns reused arrays; the tensor API returns owned tensors."""
+    wrapper = VecEnvWrapper(
+        num_envs=NUM_ENVS, obs_dim=OBS_DIM, action_dim=ACTION_DIM
+    )
+    assert not wrapper.using_cpp
+
+    obs_np = wrapper.reset()
+    step_obs, _, dones_np, _ = wrapper.step(_zero_actions())
+    assert step_obs is obs_np
+    assert dones_np.dtype == np.bool_
+
+    obs_t = wrapper.reset_tensor(torch.device("cpu"))
+    obs_before = obs_t.clone()
+    actions = torch.zeros(NUM_ENVS, ACTION_DIM)
+    obs1, rewards1, dones1, _ = wrapper.step_tensor(actions)
+    obs1_before, rewards1_before = obs1.clone(), rewards1.clone()
+    wrapper.step_tensor(actions)
+
+    # Later steps must not write into tensors already handed out
+    torch.testing.assert_close(obs_t, obs_before)
+    torch.testing.assert_close(obs1, obs1_before)
+    torch.testing.assert_close(rewards1, rewards1_before)
+    assert dones1.dtype == torch.float32
+
+    obs_out = torch.empty(NUM_ENVS, OBS_DIM)
+    obs2, _, _, _ = wrapper.step_tensor(actions, obs_out=obs_out)
+    assert obs2 is obs_out
+
+
+def test_cpp_dones_view_across_resets():
+    """dones_view must match the step's dones through several auto-resets."""
+    jolt_training = pytest.importorskip("jolt_training")
+    if not os.path.exists(_SKELETON_PATH):
+        pytest.skip(f"skeleton not found: {_SKELETON_PATH}")
+
+    config = jolt_training.EnvConfig()
+    config.max_episode_steps = MAX_EPISODE_STEPS
+    env = jolt_training.VecEnv(NUM_ENVS, _SKELETON_PATH, config)
+    env.reset()
+    dones_view = env.dones_view
+    actions = np.zeros((NUM_ENVS, env.action_dim), dtype=np.float32)
+
+    resets = 0
+    for step in range(4 * MAX_EPISODE_STEPS):
+        _, _, dones = env.step_with_autoreset(actions)
+        np.testing.assert_array_equal(
+            dones_view, dones, err_msg=f"dones_view stale at step {step}"
+        )
+        resets += int(dones.any())
+
+    assert resets >= 2, f"Expected at least two reset steps, got {resets}"
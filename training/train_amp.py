@@ -43,7 +43,9 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 import numpy as np
 import torch
@@ -219,6 +221,26 @@ def parse_args() -> argparse.Namespace:
         default=4,
         help="Number of PPO optimization epochs per rollout",
     )
+    parser.add_argument(
+        "--full-batch",
+        action="store_true",
+        help="Run each PPO epoch as one pass over the whole rollout instead of mini-batches",
+    )
+    parser.add_argument(
+        "--preshuffle",
+        action="store_true",
+        help="Copy the rollout into a shuffled buffer each epoch so mini-batches are contiguous slices (doubles rollout memory)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="torch.compile the rollout forwards and the PPO loss (reduce-overhead)",
+    )
+    parser.add_argument(
+        "--cuda-graph",
+        action="store_true",
+        help="Capture the per-step policy/value forward as a CUDA graph (CUDA only)",
+    )
 
     # AMP discriminator
     parser.add_argument(
@@ -236,6 +258,16 @@ def parse_args() -> argparse.Namespace:
         help="Torch device (auto/cpu/cuda/cuda:0)",
     )
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--bf16-storage",
+        action="store_true",
+        help="Store rollout observations/actions/latents in bfloat16",
+    )
+    parser.add_argument(
+        "--no-expandable-segments",
+        action="store_true",
+        help="Do not enable expandable segments in the CUDA caching allocator",
+    )
 
     return parser.parse_args()
 
@@ -341,9 +373,114 @@ def build_networks(
         for param in nets["llc"].parameters():
             param.requires_grad = False
 
+    if args.compile:
+        compile_rollout_networks(nets)
+
     return nets
 
 
+def compile_rollout_networks(nets: dict) -> None:
+    """Compile the per-step rollout forwards in place with torch.compile.
+
+    Rollout batches always have shape (num_envs, ...), so reduce-overhead
+    mode can replay them as CUDA graphs. Methods are compiled on the module
+    instances rather than wrapping the modules, so state_dict keys (and
+    therefore checkpoints) are unchanged. The value network's own forward is
+    left eager because the PPO update also calls it, with autograd and
+    varying mini-batch shapes; the rollout uses a separately compiled
+    ``rollout_forward`` instead. The discriminator is left eager: its WGAN-GP
+    term needs double backward, which compiled graphs do not support.
+
+    Args:
+        nets: Dict of networks from build_networks.
+    """
+    mode = "reduce-overhead"
+    value_net = nets["value"]
+    value_net.rollout_forward = torch.compile(value_net.forward, mode=mode)
+
+    policy = nets["policy"]
+    if isinstance(policy, HLCPolicy):
+        policy.get_latent = torch.compile(policy.get_latent, mode=mode)
+    else:
+        policy.get_actions = torch.compile(policy.get_actions, mode=mode)
+
+    if "llc" in nets:
+        nets["llc"].get_actions = torch.compile(nets["llc"].get_actions, mode=mode)
+
+
+class CheckpointWriter:
+    """Writes checkpoints to disk on a single background thread.
+
+    Serialization and file I/O overlap the following training epochs. At
+    most one write is in flight: a new submission first waits for the
+    previous one, which bounds the host memory held by snapshots.
+
+    Frozen networks (e.g. the HLC's LLC) never change, so their host
+    snapshot is taken once and reused for every later checkpoint.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
+        self.frozen_snapshots: dict[str, dict] = {}
+
+    def submit(self, checkpoint: dict, path: str, epoch: int) -> None:
+        """Queue a host-resident checkpoint for writing.
+
+        Args:
+            checkpoint: Checkpoint dict whose tensors are all on the host and
+                no longer modified by training.
+            path: Output file path.
+            epoch: Epoch number, for logging.
+        """
+        self.wait()
+        self._pending = self._executor.submit(_write_checkpoint, checkpoint, path, epoch)
+
+    def wait(self) -> None:
+        """Block until the in-flight write (if any) has finished.
+
+        Raises:
+            Exception: Re-raises any error from the background write.
+        """
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self) -> None:
+        """Finish the in-flight write and stop the background thread."""
+        self.wait()
+        self._executor.shutdown()
+
+
+def _write_checkpoint(checkpoint: dict, path: str, epoch: int) -> None:
+    """Serialize a checkpoint dict to disk."""
+    os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
+    torch.save(checkpoint, path)
+    logger.info("Saved checkpoint: %s (epoch %d)", path, epoch)
+
+
+def _snapshot_to_host(obj):
+    """Copy every tensor in a (nested) state dict to host memory.
+
+    CUDA tensors are copied into pinned memory with non_blocking copies (the
+    caller synchronizes once); CPU tensors are cloned so later in-place
+    training updates do not leak into the snapshot.
+    """
+    if isinstance(obj, torch.Tensor):
+        tensor = obj.detach()
+        if tensor.is_cuda:
+            host = torch.empty(
+                tensor.shape, dtype=tensor.dtype, pin_memory=True
+            )
+            return host.copy_(tensor, non_blocking=True)
+        return tensor.clone()
+    if isinstance(obj, dict):
+        return {key: _snapshot_to_host(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_snapshot_to_host(value) for value in obj)
+    return obj
+
+
 def save_checkpoint(
     path: str,
     epoch: int,
@@ -351,6 +488,7 @@ def save_checkpoint(
     ppo_trainer: PPOTrainer,
     amp_trainer: AMPTrainer,
     args: argparse.Namespace,
+    writer: Optional[CheckpointWriter] = None,
 ) -> None:
     """Save a training checkpoint.
 
@@ -361,6 +499,9 @@ def save_checkpoint(
         ppo_trainer: PPO trainer (for optimizer state).
         amp_trainer: AMP trainer (for discriminator optimizer state).
         args: Original command-line arguments.
+        writer: Optional background writer. If given, only the host
+            snapshot is taken here and the file is written asynchronously;
+            otherwise the checkpoint is written before returning.
     """
     checkpoint = {
         "epoch": epoch,
@@ -369,16 +510,29 @@ def save_checkpoint(
     }
 
     # Save all network state dicts
+    frozen = writer.frozen_snapshots if writer is not None else {}
     for name, net in nets.items():
-        checkpoint[f"net_{name}"] = net.state_dict()
+        if name in frozen:
+            checkpoint[f"net_{name}"] = frozen[name]
+            continue
+        state = _snapshot_to_host(net.state_dict())
+        params = list(net.parameters())
+        if writer is not None and params and not any(p.requires_grad for p in params):
+            frozen[name] = state
+        checkpoint[f"net_{name}"] = state
 
     # Save optimizer states
-    checkpoint["ppo_optimizer"] = ppo_trainer.optimizer.state_dict()
-    checkpoint["disc_optimizer"] = amp_trainer.optimizer.state_dict()
+    checkpoint["ppo_optimizer"] = _snapshot_to_host(ppo_trainer.optimizer.state_dict())
+    checkpoint["disc_optimizer"] = _snapshot_to_host(amp_trainer.optimizer.state_dict())
 
-    os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
-    torch.save(checkpoint, path)
-    logger.info("Saved checkpoint: %s (epoch %d)", path, epoch)
+    # Wait for the non_blocking device-to-host copies
+    if torch.cuda.is_initialized():
+        torch.cuda.synchronize()
+
+    if writer is None:
+        _write_checkpoint(checkpoint, path, epoch)
+    else:
+        writer.submit(checkpoint, path, epoch)
 
 
 def load_checkpoint(
@@ -398,7 +552,11 @@ def load_checkpoint(
     Returns:
         Epoch number to resume from.
     """
-    checkpoint = torch.load(path, weights_only=False)
+    # Checkpoints hold only tensors and plain containers/primitives (args is
+    # stored as a dict), so the restricted weights_only unpickler suffices.
+    # mmap pages tensors in lazily instead of reading the whole file first;
+    # load_state_dict then copies them onto the networks' devices.
+    checkpoint = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
 
     for name, net in nets.items():
         key = f"net_{name}"
@@ -417,31 +575,78 @@ def load_checkpoint(
     return epoch
 
 
-def collect_amp_obs(obs_buffer: list[np.ndarray]) -> torch.Tensor:
-    """Concatenate collected observations into an AMP observation tensor.
+class MotionWindowSampler:
+    """Device-resident batched sampler of fixed-length AMP observation windows.
 
-    For simplicity, we use the single-frame observations directly as AMP
-    observations. In a full implementation, you would compute the AMP-specific
-    features (heading-invariant root state, DOF positions/velocities, etc.)
-    from the raw physics state.
+    The AMP observations of every clip are concatenated once into a single
+    (total_frames, obs_dim) tensor on the training device, with per-clip
+    start offsets and lengths, so a whole batch of windows is drawn and
+    gathered on device with no host loop or host-to-device copy.
 
     Args:
-        obs_buffer: List of observation arrays from the rollout.
-
-    Returns:
-        Stacked tensor of AMP observations, shape (total_steps, obs_dim).
+        motion_dataset: Dataset of motion clips.
+        window_steps: Number of consecutive frames per window.
+        device: Torch device to keep the motion cache on.
     """
-    if not obs_buffer:
-        return torch.empty(0)
-    return torch.from_numpy(np.concatenate(obs_buffer, axis=0))
+
+    def __init__(
+        self,
+        motion_dataset: MotionDataset,
+        window_steps: int,
+        device: torch.device,
+    ):
+        clip_obs = [
+            clip.amp_observations
+            for clip in motion_dataset.clips
+            if clip.amp_observations.shape[0] > 0
+        ]
+        self.window_steps = window_steps
+        self.device = device
+        self.num_clips = len(clip_obs)
+
+        lengths = np.array([obs.shape[0] for obs in clip_obs], dtype=np.int64)
+        starts = np.zeros(self.num_clips, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        self.lengths = torch.from_numpy(lengths).to(device)
+        self.starts = torch.from_numpy(starts).to(device)
+        self.amp_obs = (
+            torch.from_numpy(np.concatenate(clip_obs).astype(np.float32, copy=False))
+            if clip_obs
+            else torch.zeros(0, 0)
+        ).to(device)
+        self._steps = torch.arange(window_steps, device=device)
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        """Sample one random window per batch element.
+
+        Clips are drawn uniformly and the window start uniformly within the
+        clip. Windows of clips shorter than window_steps repeat the last frame.
+
+        Args:
+            batch_size: Number of windows.
+
+        Returns:
+            (batch_size, window_steps * obs_dim) float32 tensor on device.
+        """
+        clip_idx = torch.randint(
+            0, self.num_clips, (batch_size,), device=self.device
+        )
+        lengths = self.lengths[clip_idx]
+        max_start = (lengths - self.window_steps).clamp_(min=0)
+        offsets = (
+            torch.rand(batch_size, device=self.device) * (max_start + 1)
+        ).long()
+        frames = torch.minimum(
+            offsets[:, None] + self._steps, lengths[:, None] - 1
+        )
+        windows = self.amp_obs[self.starts[clip_idx, None] + frames]
+        return windows.flatten(1)
 
 
 def sample_latents_for_calm(
     encoder: torch.nn.Module,
-    motion_dataset: MotionDataset,
+    window_sampler: MotionWindowSampler,
     num_envs: int,
-    obs_dim: int,
-    encoder_obs_steps: int,
     device: torch.device,
 ) -> torch.Tensor:
     """Sample per-environment latent codes using the motion encoder.
@@ -452,44 +657,142 @@ def sample_latents_for_calm(
 
     Args:
         encoder: MotionEncoder network.
-        motion_dataset: Dataset of motion clips.
+        window_sampler: Window sampler over the motion dataset.
         num_envs: Number of environments.
-        obs_dim: Single-frame observation dimension.
-        encoder_obs_steps: Number of temporal frames to stack.
         device: Torch device.
 
     Returns:
         Latent codes, shape (num_envs, latent_dim).
     """
-    if len(motion_dataset.clips) == 0:
+    if window_sampler.num_clips == 0:
         return torch.zeros(num_envs, DEFAULT_LATENT_DIM, device=device)
 
-    stacked_obs_list = []
-    for _ in range(num_envs):
-        clip = motion_dataset.sample_clip()
-        amp_obs = clip.amp_observations  # (N-1, obs_dim)
+    with torch.inference_mode():
+        latents = encoder(window_sampler.sample(num_envs))
 
-        if amp_obs.shape[0] >= encoder_obs_steps:
-            start = np.random.randint(0, amp_obs.shape[0] - encoder_obs_steps + 1)
-            window = amp_obs[start : start + encoder_obs_steps]
-        else:
-            # Pad with repetition if clip is too short
-            window = np.zeros((encoder_obs_steps, obs_dim), dtype=np.float32)
-            n = min(amp_obs.shape[0], encoder_obs_steps)
-            window[:n] = amp_obs[:n]
-            for j in range(n, encoder_obs_steps):
-                window[j] = amp_obs[-1]
+    return latents
 
-        stacked_obs_list.append(window.flatten())
 
-    stacked_obs = torch.from_numpy(
-        np.array(stacked_obs_list, dtype=np.float32)
-    ).to(device)
+def make_rollout_step(
+    mode: str,
+    nets: dict,
+    z_amp: torch.Tensor,
+    task_obs: torch.Tensor,
+) -> Callable[
+    [torch.Tensor, torch.Tensor],
+    tuple[
+        torch.Tensor,
+        torch.Tensor,
+        torch.Tensor,
+        torch.Tensor,
+        torch.Tensor,
+        Optional[torch.Tensor],
+    ],
+]:
+    """Build the per-step policy/value forward for a training mode.
+
+    The mode is resolved once here so the rollout loop makes a single call
+    per step with no mode branching or dict lookups.
 
-    with torch.no_grad():
-        latents = encoder(stacked_obs)
+    Args:
+        mode: Training mode ("amp", "calm" or "hlc").
+        nets: Dict of networks from build_networks.
+        z_amp: Fixed zero latents used in AMP mode, (num_envs, latent_dim).
+        task_obs: Preallocated HLC task observation tensor,
+            (num_envs, task_obs_dim); refreshed in place each step.
 
-    return latents
+    Returns:
+        Callable ``step(obs, latents)`` returning a tuple of
+        (actions, log_probs, values, stored_obs, stored_actions,
+        stored_latents), where the ``stored_*`` entries are what the rollout
+        buffer records for this mode. Must be called under inference_mode.
+    """
+    policy = nets["policy"]
+    # Compiled rollout-only forward if compile_rollout_networks set one
+    value_net = getattr(nets["value"], "rollout_forward", nets["value"])
+
+    if mode == "amp":
+        # AMP mode: fixed z=0
+        def step(obs, latents):
+            actions, log_probs = policy.get_actions(z_amp, obs)
+            values = value_net(obs).squeeze(-1)
+            return actions, log_probs, values, obs, actions, None
+
+    elif mode == "calm":
+        # CALM mode: per-env latent from encoder
+        def step(obs, latents):
+            actions, log_probs = policy.get_actions(latents, obs)
+            values = value_net(obs).squeeze(-1)
+            return actions, log_probs, values, obs, actions, latents
+
+    else:
+        # HLC mode: policy outputs latent, frozen LLC produces actions
+        # For HLC, obs is the task observation (simplified: use first
+        # task_obs_dim features of the full obs as task obs placeholder)
+        llc = nets["llc"]
+        llc_dtype = next(llc.parameters()).dtype
+        task_obs_dim = task_obs.shape[1]
+
+        def step(obs, latents):
+            task_obs.copy_(obs[:, :task_obs_dim])
+            z, log_probs = policy.get_latent(task_obs)
+            actions = llc.get_actions(
+                z.to(llc_dtype), obs.to(llc_dtype), deterministic=True
+            )[0].float()
+            values = value_net(task_obs).squeeze(-1)
+            return actions, log_probs, values, task_obs, z, z
+
+    return step
+
+
+class CUDAGraphRolloutStep:
+    """Rollout step captured once as a CUDA graph and replayed every step.
+
+    Wraps a step from make_rollout_step. Each call copies the inputs into
+    static tensors, replays the captured kernels, and returns the static
+    outputs. Those are overwritten by the next call, so they must be
+    consumed first (the rollout loop copies them via env.step_tensor and
+    buffer.add). Shapes are fixed at capture; latents must be updated in
+    place rather than resized. Like the wrapped step, it must be called
+    under inference_mode.
+
+    Args:
+        step: Rollout step callable to capture.
+        obs: Example observations, fixing the captured shape.
+        latents: Example latents, fixing the captured shape.
+        warmup_steps: Eager iterations on a side stream before capture, so
+            lazy initialization and allocator state settle first.
+    """
+
+    def __init__(
+        self,
+        step: Callable,
+        obs: torch.Tensor,
+        latents: torch.Tensor,
+        warmup_steps: int = 3,
+    ):
+        device = obs.device
+        with torch.inference_mode():
+            self._obs = obs.clone()
+            self._latents = latents.clone()
+
+            side_stream = torch.cuda.Stream(device)
+            side_stream.wait_stream(torch.cuda.current_stream(device))
+            with torch.cuda.stream(side_stream):
+                for _ in range(warmup_steps):
+                    step(self._obs, self._latents)
+            torch.cuda.current_stream(device).wait_stream(side_stream)
+
+            self._graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(self._graph):
+                self._outputs = step(self._obs, self._latents)
+
+    def __call__(self, obs: torch.Tensor, latents: torch.Tensor) -> tuple:
+        """Replay the captured step on new inputs."""
+        self._obs.copy_(obs)
+        self._latents.copy_(latents)
+        self._graph.replay()
+        return self._outputs
 
 
 def train(args: argparse.Namespace) -> None:
@@ -499,6 +802,12 @@ def train(args: argparse.Namespace) -> None:
         args: Parsed command-line arguments.
     """
     # Setup
+    # Expandable segments let the CUDA caching allocator grow segments in
+    # place instead of fragmenting. The allocator reads this on its first
+    # allocation, so it must be set before anything touches CUDA; an
+    # explicit PYTORCH_CUDA_ALLOC_CONF from the environment wins.
+    if not args.no_expandable_segments:
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
     torch.manual_seed(args.seed)
     np.random.seed(args.seed)
     device = get_device(args.device)
@@ -523,6 +832,7 @@ def train(args: argparse.Namespace) -> None:
         motions_dir=args.motions_fbx,
         obs_dim=DEFAULT_OBS_DIM,
         action_dim=DEFAULT_ACTION_DIM,
+        dummy_device=str(device),
     )
     obs_dim = env.obs_dim
     action_dim = env.action_dim
@@ -546,6 +856,8 @@ def train(args: argparse.Namespace) -> None:
         value_coeff=args.value_coeff,
         max_grad_norm=args.max_grad_norm,
         num_update_epochs=args.ppo_epochs,
+        full_batch_forward=args.full_batch,
+        compile_loss=args.compile,
     )
 
     amp_trainer = AMPTrainer(
@@ -563,6 +875,8 @@ def train(args: argparse.Namespace) -> None:
         obs_dim=obs_dim,
         action_dim=action_dim,
         device=device,
+        storage_dtype=torch.bfloat16 if args.bf16_storage else torch.float32,
+        preshuffle=args.preshuffle,
     )
     if args.mode in ("calm", "hlc"):
         buffer.enable_latent_storage(DEFAULT_LATENT_DIM)
@@ -573,25 +887,88 @@ def train(args: argparse.Namespace) -> None:
         start_epoch = load_checkpoint(args.resume, nets, ppo_trainer, amp_trainer)
 
     # Initialize environment
-    obs_np = env.reset()
-    obs = torch.from_numpy(obs_np).to(device)
+    obs = env.reset_tensor(device)
+
+    # HLC task observations: a contiguous copy of the leading obs features,
+    # refreshed in place each step and shared by the policy, value and buffer
+    task_obs_dim = TASK_OBS_DIMS.get(args.task, 3)
+    task_obs = torch.empty(args.num_envs, task_obs_dim, device=device)
+
+    # Fixed z=0 for AMP mode, allocated once and never written
+    z_amp = torch.zeros(args.num_envs, DEFAULT_LATENT_DIM, device=device)
 
     # Per-env latent codes for CALM mode
     latents = torch.zeros(args.num_envs, DEFAULT_LATENT_DIM, device=device)
     if args.mode == "calm" and "encoder" in nets:
+        window_sampler = MotionWindowSampler(
+            motion_dataset, DEFAULT_ENCODER_OBS_STEPS, device
+        )
         latents = sample_latents_for_calm(
-            nets["encoder"],
-            motion_dataset,
-            args.num_envs,
-            obs_dim,
-            DEFAULT_ENCODER_OBS_STEPS,
-            device,
+            nets["encoder"], window_sampler, args.num_envs, device
         )
 
+    # Policy observations of the rollout, reused every epoch for the
+    # discriminator. For simplicity the single-frame observations are used
+    # directly as AMP observations; a full implementation would compute the
+    # AMP-specific features (heading-invariant root state, DOF positions/
+    # velocities, etc.) from the raw physics state.
+    amp_obs_all = torch.empty(
+        (args.steps_per_epoch, args.num_envs, obs_dim), device=device
+    )
+
+    # Per-step style rewards, blended into the task reward during the rollout
+    style_rewards_all = torch.empty(
+        (args.steps_per_epoch, args.num_envs), device=device
+    )
+    style_weight = args.style_reward_weight
+
     # Tracking for latent resampling in CALM mode
-    latent_step_counters = np.zeros(args.num_envs, dtype=np.int32)
+    latent_step_counters = torch.zeros(
+        args.num_envs, dtype=torch.int32, device=device
+    )
     latent_resample_interval = 150  # Re-encode latent every N steps
 
+    # Side stream for CALM latent re-encoding (None runs it on the current
+    # stream); resampled latents wait here until they can be applied
+    encoder_stream: Optional[torch.cuda.Stream] = None
+    if args.mode == "calm" and device.type == "cuda":
+        encoder_stream = torch.cuda.Stream(device)
+    pending_latents: Optional[tuple[torch.Tensor, torch.Tensor]] = None
+
+    # Side stream for the discriminator update (None runs it in line)
+    disc_stream: Optional[torch.cuda.Stream] = None
+    if device.type == "cuda":
+        disc_stream = torch.cuda.Stream(device)
+
+    # Checkpoints are serialized and written in the background
+    checkpoint_writer = CheckpointWriter()
+
+    # The frozen LLC only runs deterministic rollout forwards, so on GPUs
+    # with bfloat16 support its weights are stored in bfloat16 to halve
+    # weight traffic and use bf16 tensor cores. This happens after any
+    # resume, and the fp32 weights are snapshotted as the LLC's frozen
+    # checkpoint state first, so checkpoints never store the rounded copy.
+    if "llc" in nets and device.type == "cuda" and torch.cuda.is_bf16_supported():
+        checkpoint_writer.frozen_snapshots["llc"] = _snapshot_to_host(
+            nets["llc"].state_dict()
+        )
+        nets["llc"].to(dtype=torch.bfloat16)
+
+    # Hot-loop config, resolved once
+    steps_per_epoch = args.steps_per_epoch
+    rollout_step = make_rollout_step(args.mode, nets, z_amp, task_obs)
+    if args.cuda_graph:
+        if device.type != "cuda":
+            logger.warning("--cuda-graph requires a CUDA device; running eagerly")
+        elif args.compile:
+            logger.warning(
+                "--cuda-graph ignored with --compile (reduce-overhead mode "
+                "already replays CUDA graphs)"
+            )
+        else:
+            rollout_step = CUDAGraphRolloutStep(rollout_step, obs, latents)
+    encoder = nets.get("encoder") if args.mode == "calm" else None
+
     logger.info("Starting training from epoch %d", start_epoch)
     logger.info(
         "Hyperparams: lr=%.1e, disc_lr=%.1e, clip_eps=%.2f, gamma=%.3f, "
@@ -611,118 +988,91 @@ def train(args: argparse.Namespace) -> None:
     for epoch in range(start_epoch, args.epochs):
         epoch_start = time.time()
         buffer.reset()
-        amp_obs_buffer: list[np.ndarray] = []
 
         # --- Rollout collection ---
-        for step in range(args.steps_per_epoch):
-            with torch.no_grad():
-                if args.mode == "amp":
-                    # AMP mode: fixed z=0
-                    z = torch.zeros(
-                        args.num_envs, DEFAULT_LATENT_DIM, device=device
-                    )
-                    actions, log_probs = nets["policy"].get_actions(z, obs)
-                    values = nets["value"](obs).squeeze(-1)
-
-                elif args.mode == "calm":
-                    # CALM mode: per-env latent from encoder
-                    actions, log_probs = nets["policy"].get_actions(latents, obs)
-                    values = nets["value"](obs).squeeze(-1)
-
-                elif args.mode == "hlc":
-                    # HLC mode: policy outputs latent, frozen LLC produces actions
-                    # For HLC, obs is the task observation (simplified: use first
-                    # task_obs_dim features of the full obs as task obs placeholder)
-                    task_obs_dim = TASK_OBS_DIMS.get(args.task, 3)
-                    task_obs = obs[:, :task_obs_dim]
-                    z, log_probs = nets["policy"].get_latent(task_obs)
-                    actions = nets["llc"].get_actions(z, obs, deterministic=True)[0]
-                    values = nets["value"](task_obs).squeeze(-1)
-                    latents = z  # Store for buffer
-
-            # Step environment
-            actions_np = actions.cpu().numpy()
-            obs_np, rewards_np, dones_np, infos = env.step(actions_np)
-
-            # Reset done environments using random motion frames from FBX library.
-            # This snaps ragdolls to reference animation poses instead of default standing.
-            env.reset_done_with_motions()
-
-            # Store AMP observations for discriminator training
-            amp_obs_buffer.append(obs_np.copy())
-
-            # Convert to tensors
-            rewards_t = torch.from_numpy(rewards_np).to(device)
-            dones_t = torch.from_numpy(dones_np).to(device)
-            obs_next = torch.from_numpy(obs_np).to(device)
-
-            # Store in buffer
-            if args.mode == "hlc":
-                buffer.add(
-                    obs[:, : TASK_OBS_DIMS.get(args.task, 3)],
-                    latents,
-                    log_probs,
-                    rewards_t,
-                    dones_t,
-                    values,
-                    latents,
-                )
-            else:
-                buffer.add(
-                    obs,
+        for step in range(steps_per_epoch):
+            with torch.inference_mode():
+                (
                     actions,
                     log_probs,
-                    rewards_t,
-                    dones_t,
                     values,
-                    latents if args.mode == "calm" else None,
+                    stored_obs,
+                    stored_actions,
+                    stored_latents,
+                ) = rollout_step(obs, latents)
+
+            # Step environment (device tensors in, device tensors out). The
+            # next observations land directly in this step's slot of the AMP
+            # observation store used for discriminator training. With a
+            # single step per epoch that slot still holds the current obs,
+            # which the buffer has not stored yet, so the env returns a new
+            # tensor the loop owns and it is copied into the slot afterwards.
+            obs_slot = amp_obs_all[step]
+            obs_next, rewards_t, dones_t, infos = env.step_tensor(
+                actions, obs_out=obs_slot if steps_per_epoch > 1 else None
+            )
+            if steps_per_epoch == 1:
+                obs_slot.copy_(obs_next)
+
+            # CALM: resample latents for terminated episodes. On CUDA the
+            # encoder runs on its own stream, overlapping the style scoring
+            # and buffer writes below; the new latents are applied once this
+            # step's latents have been stored.
+            if encoder is not None:
+                latent_step_counters += 1
+                need_resample = (dones_t > 0.5) | (
+                    latent_step_counters >= latent_resample_interval
                 )
+                latent_step_counters.masked_fill_(need_resample, 0)
+                resample_indices = torch.nonzero(need_resample, as_tuple=True)[0]
+
+                num_resample = resample_indices.numel()
+                if num_resample > 0:
+                    with torch.cuda.stream(encoder_stream):
+                        new_latents = sample_latents_for_calm(
+                            encoder, window_sampler, num_resample, device
+                        )
+                    pending_latents = (resample_indices, new_latents)
+
+            # Blend the style reward into the task reward. The discriminator
+            # is fixed for the whole rollout, so scoring each step as it
+            # arrives matches a post-rollout pass and overlaps the env step.
+            style_t = amp_trainer.compute_style_reward(
+                obs_next, out=style_rewards_all[step]
+            )
+            rewards_t.mul_(1.0 - style_weight).add_(style_t, alpha=style_weight)
+
+            # Store in buffer
+            buffer.add(
+                stored_obs,
+                stored_actions,
+                log_probs,
+                rewards_t,
+                dones_t,
+                values,
+                stored_latents,
+            )
 
             obs = obs_next
 
-            # CALM: resample latents for terminated episodes
-            if args.mode == "calm" and "encoder" in nets:
-                latent_step_counters += 1
-                terminated_mask = dones_np > 0.5
-                resample_mask = latent_step_counters >= latent_resample_interval
-                need_resample = terminated_mask | resample_mask
-                resample_indices = np.where(need_resample)[0]
-
-                if len(resample_indices) > 0:
-                    new_latents = sample_latents_for_calm(
-                        nets["encoder"],
-                        motion_dataset,
-                        len(resample_indices),
-                        obs_dim,
-                        DEFAULT_ENCODER_OBS_STEPS,
-                        device,
-                    )
+            # Apply resampled latents before the next policy forward
+            if pending_latents is not None:
+                resample_indices, new_latents = pending_latents
+                if encoder_stream is not None:
+                    current_stream = torch.cuda.current_stream(device)
+                    current_stream.wait_stream(encoder_stream)
+                    new_latents.record_stream(current_stream)
+                # latents comes from the encoder under inference_mode, so it
+                # can only be updated in place there
+                with torch.inference_mode():
                     latents[resample_indices] = new_latents
-                    latent_step_counters[resample_indices] = 0
-
-        # --- Compute AMP style rewards ---
-        policy_amp_obs = collect_amp_obs(amp_obs_buffer).to(device)
-
-        if policy_amp_obs.shape[0] > 0:
-            style_rewards = amp_trainer.compute_style_reward(policy_amp_obs)
-            # Reshape to (steps, envs)
-            style_rewards_2d = style_rewards.view(
-                args.steps_per_epoch, args.num_envs
-            )
-        else:
-            style_rewards_2d = torch.zeros(
-                args.steps_per_epoch, args.num_envs, device=device
-            )
-
-        # Blend style reward with task reward
-        w = args.style_reward_weight
-        buffer.rewards = w * style_rewards_2d + (1.0 - w) * buffer.rewards
+                pending_latents = None
 
         # --- Compute returns and advantages ---
-        with torch.no_grad():
+        with torch.inference_mode():
             if args.mode == "hlc":
-                task_obs_dim = TASK_OBS_DIMS.get(args.task, 3)
-                last_values = nets["value"](obs[:, :task_obs_dim]).squeeze(-1)
+                task_obs.copy_(obs[:, :task_obs_dim])
+                last_values = nets["value"](task_obs).squeeze(-1)
             else:
                 last_values = nets["value"](obs).squeeze(-1)
             last_dones = dones_t
@@ -734,11 +1084,22 @@ def train(args: argparse.Namespace) -> None:
             gae_lambda=args.gae_lambda,
         )
 
+        # --- Discriminator update ---
+        # Independent of the PPO update (disjoint parameters and inputs), so
+        # on CUDA it runs on a side stream concurrently with it
+        if disc_stream is not None:
+            disc_stream.wait_stream(torch.cuda.current_stream(device))
+        with torch.cuda.stream(disc_stream):
+            disc_stat_values = amp_trainer.update_async(amp_obs_all.view(-1, obs_dim))
+
         # --- PPO update ---
         ppo_stats = ppo_trainer.update(buffer, batch_size=args.batch_size)
 
-        # --- Discriminator update ---
-        disc_stats = amp_trainer.update(policy_amp_obs)
+        # The next rollout scores with the discriminator and overwrites the
+        # AMP observations it reads
+        if disc_stream is not None:
+            torch.cuda.current_stream(device).wait_stream(disc_stream)
+        disc_stats = dict(zip(AMPTrainer.STAT_NAMES, disc_stat_values.tolist()))
 
         # --- CALM: update encoder (optional, using contrastive loss) ---
         if args.mode == "calm" and "encoder" in nets:
@@ -750,7 +1111,7 @@ def train(args: argparse.Namespace) -> None:
         # --- Logging ---
         epoch_time = time.time() - epoch_start
         mean_reward = buffer.rewards.mean().item()
-        mean_style_reward = style_rewards_2d.mean().item()
+        mean_style_reward = style_rewards_all.mean().item()
 
         logger.info(
             "Epoch %4d/%d | time %.1fs | reward %.4f | style_r %.4f | "
@@ -775,8 +1136,18 @@ def train(args: argparse.Namespace) -> None:
         if (epoch + 1) % args.save_interval == 0 or (epoch + 1) == args.epochs:
             ckpt_name = f"{args.mode}_epoch_{epoch + 1}.pt"
             ckpt_path = os.path.join(args.output, ckpt_name)
-            save_checkpoint(ckpt_path, epoch + 1, nets, ppo_trainer, amp_trainer, args)
+            save_checkpoint(
+                ckpt_path,
+                epoch + 1,
+                nets,
+                ppo_trainer,
+                amp_trainer,
+                args,
+                writer=checkpoint_writer,
+            )
 
+    checkpoint_writer.close()
+    env.close()
     logger.info("Training complete. %d epochs.", args.epochs)
 
 
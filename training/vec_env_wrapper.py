@@ -9,8 +9,14 @@ The C++ module ``jolt_training`` exposes:
   - ``VecEnv(num_envs, skeleton_path, config=EnvConfig())``: Constructor
   - ``reset() -> np.ndarray``: Reset all envs, return obs (num_envs, obs_dim)
   - ``step(actions) -> (obs, rewards, dones)``: Step all envs
+  - ``step_with_autoreset(actions) -> (obs, rewards, dones)``: Step all envs,
+    then reset done envs with random motion frames in the same call
+  - ``step_inplace(actions, autoreset=True)``: Step all envs, writing into
+    the persistent ``obs_view``/``rewards_view``/``dones_view`` arrays
   - ``load_motions(directory) -> int``: Load FBX animations for resets
   - ``load_motion_file(path) -> int``: Load single FBX animation
+  - ``load_motion_files(paths) -> int``: Load several FBX animations in
+    one call
   - ``reset_done_with_motions()``: Reset done envs with random motion frames
   - ``amp_observations() -> np.ndarray``: Get AMP observations
   - ``set_task(task_type, target)``: Set task goal
@@ -20,9 +26,16 @@ import logging
 from typing import Optional
 
 import numpy as np
+import torch
+
+from training._rng import fill_normal_numpy
 
 logger = logging.getLogger(__name__)
 
+# Shared info dict for envs with nothing to report this step. It is aliased
+# across envs and steps, so consumers must treat infos as read-only.
+_EMPTY_INFO: dict = {}
+
 # Try to import the C++ vectorized environment module
 _has_cpp_env = False
 try:
@@ -36,6 +49,31 @@ except ImportError:
         "Training loop will run with random observations."
     )
 
+# Observation noise fill, resolved on first use: the parallel Numba kernel if
+# numba is installed, else the NumPy version of the same generator. Importing
+# lazily keeps numba (and its compile) out of processes that never step a
+# DummyVecEnv.
+_fill_normal = None
+
+
+def _get_fill_normal():
+    """Return the observation noise fill, importing the Numba kernel once."""
+    global _fill_normal
+    if _fill_normal is None:
+        try:
+            from training._rng_numba import fill_normal
+        except ImportError:
+            fill_normal = fill_normal_numpy
+        _fill_normal = fill_normal
+    return _fill_normal
+
+
+def _as_actions(actions: np.ndarray) -> np.ndarray:
+    """Return actions as a C-contiguous float32 array, copying only if needed."""
+    if actions.dtype != np.float32 or not actions.flags.c_contiguous:
+        actions = np.ascontiguousarray(actions, dtype=np.float32)
+    return actions
+
 
 class DummyVecEnv:
     """Dummy vectorized environment for testing the training loop.
@@ -44,11 +82,22 @@ class DummyVecEnv:
     simulation. Useful for verifying that the training pipeline runs
     end-to-end before the C++ environment is compiled.
 
+    Per-env episode state is kept as parallel (num_envs,) arrays indexed by
+    env, updated with vectorized ops; gym-style info dicts are only built for
+    the envs that terminate on a given step.
+
+    Observations come from a counter-based generator (see training._rng), so
+    a given seed yields the same observation sequence whether or not numba
+    is installed; numba only makes the fill parallel.
+
     Args:
         num_envs: Number of parallel environments.
         obs_dim: Observation vector dimension (default matches CALM config).
         action_dim: Action vector dimension (default matches CALM config).
         episode_length: Number of steps before automatic episode reset.
+        device: Device that reset_tensor/step_tensor generate data on. With a
+            CUDA device, observations and rewards are drawn on the GPU and
+            never cross the host boundary.
     """
 
     def __init__(
@@ -57,6 +106,7 @@ class DummyVecEnv:
         obs_dim: int = 102,
         action_dim: int = 37,
         episode_length: int = 300,
+        device: str = "cpu",
     ):
         self.num_envs = num_envs
         self.obs_dim = obs_dim
@@ -67,40 +117,113 @@ class DummyVecEnv:
         self.num_motions = 0
         self.motion_duration = 0.0
 
+        # Per-env episode state
         self._step_counts = np.zeros(num_envs, dtype=np.int32)
+        self._episode_returns = np.zeros(num_envs, dtype=np.float32)
         self._rng = np.random.default_rng(seed=42)
+        # Seed and running fill index for the counter-based observation
+        # fills, which are reproducible regardless of backend or thread count
+        self._fill_seed = 42
+        self._fill_stream = 0
+
+        # Output buffers reused every step; step() and reset() return them
+        self._obs_buf = np.empty((num_envs, obs_dim), dtype=np.float32)
+        self._rewards_buf = np.empty(num_envs, dtype=np.float32)
+        self._dones_mask = np.empty(num_envs, dtype=bool)
+        self._amp_obs_buf = np.empty((num_envs, obs_dim), dtype=np.float32)
+        # Scratch for regenerating the observations of terminated envs; sized
+        # for the worst case so every subset is a view of the same buffer
+        self._subset_buf = np.empty((num_envs, obs_dim), dtype=np.float32)
+
+        # State and reward/done output buffers for the tensor API, kept on
+        # self.device; step_tensor() returns the buffers, like step() does
+        self.device = torch.device(device)
+        self._gen = torch.Generator(device=self.device).manual_seed(42)
+        self._step_counts_t = torch.zeros(num_envs, dtype=torch.int32, device=self.device)
+        self._dones_mask_t = torch.empty(num_envs, dtype=torch.bool, device=self.device)
+        self._rewards_t = torch.empty(num_envs, device=self.device)
+        self._dones_t = torch.empty(num_envs, device=self.device)
+        self._empty_infos = [_EMPTY_INFO] * num_envs
 
     def reset(self) -> np.ndarray:
-        """Reset all environments and return initial observations."""
-        self._step_counts[:] = 0
+        """Reset all environments and return initial observations.
+
+        The returned array is reused (overwritten) by the next step or reset.
+        """
+        self._reset_episode_state()
         return self._random_obs()
 
     def step(
         self, actions: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
-        """Step all environments with the given actions."""
+        """Step all environments with the given actions.
+
+        The actions are ignored; observations and rewards are random. dones
+        is a bool array. Like the C++ env, the returned obs/rewards/dones
+        arrays are reused (overwritten) by the next step or reset.
+        """
         self._step_counts += 1
 
         obs = self._random_obs()
-        rewards = self._rng.standard_normal(self.num_envs).astype(np.float32) * 0.1
-        dones = self._step_counts >= self.episode_length
-
-        infos: list[dict] = []
-        for i in range(self.num_envs):
-            info: dict = {}
-            if dones[i]:
-                info["episode"] = {
-                    "r": float(self._rng.standard_normal() * 10),
-                    "l": int(self._step_counts[i]),
-                }
-            infos.append(info)
-
-        terminated = np.where(dones)[0]
-        if len(terminated) > 0:
-            self._step_counts[terminated] = 0
-            obs[terminated] = self._random_obs_subset(len(terminated))
+        rewards = self._rng.standard_normal(
+            size=self.num_envs, dtype=np.float32, out=self._rewards_buf
+        )
+        np.multiply(rewards, 0.1, out=rewards)
+        np.add(self._episode_returns, rewards, out=self._episode_returns)
+        dones = np.greater_equal(
+            self._step_counts, self.episode_length, out=self._dones_mask
+        )
 
-        return obs, rewards, dones.astype(np.float32), infos
+        # Only terminated envs get their own info dict
+        infos = [_EMPTY_INFO] * self.num_envs
+        terminated = np.flatnonzero(dones)
+        if len(terminated) > 0:
+            # tolist() converts each array to Python scalars in one C call,
+            # instead of a float()/int() coercion per terminated env
+            episode_returns = self._episode_returns[terminated].tolist()
+            episode_lengths = self._step_counts[terminated].tolist()
+            for i, ret, length in zip(terminated.tolist(), episode_returns, episode_lengths):
+                infos[i] = {"episode": {"r": ret, "l": length}}
+
+            self._step_counts[dones] = 0
+            self._episode_returns[dones] = 0
+            obs[dones] = self._random_obs_subset(len(terminated))
+
+        return obs, rewards, dones, infos
+
+    def reset_tensor(self) -> torch.Tensor:
+        """Reset all environments and return initial obs on self.device."""
+        self._reset_episode_state()
+        obs = torch.empty((self.num_envs, self.obs_dim), device=self.device)
+        return self._random_obs_tensor(obs)
+
+    def step_tensor(
+        self, actions: torch.Tensor, obs_out: Optional[torch.Tensor] = None
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, list[dict]]:
+        """Tensor counterpart of step that generates results on self.device.
+
+        Like step, the returned rewards and float32 dones tensors are reused
+        (overwritten) by the next call. Observations are written into obs_out
+        when given; otherwise a new tensor the caller owns is returned, since
+        callers typically keep obs across the next step. Terminated envs already receive fresh random
+        observations, so auto-reset only restarts their step counts.
+        Episode infos are not reported, since finding terminated envs would
+        need a device sync every step.
+        """
+        self._step_counts_t += 1
+        obs = obs_out
+        if obs is None:
+            obs = torch.empty((self.num_envs, self.obs_dim), device=self.device)
+        self._random_obs_tensor(obs)
+        rewards = torch.randn(
+            self.num_envs, generator=self._gen, out=self._rewards_t
+        ).mul_(0.1)
+        terminated = torch.ge(
+            self._step_counts_t, self.episode_length, out=self._dones_mask_t
+        )
+        self._step_counts_t.masked_fill_(terminated, 0)
+        dones = self._dones_t.copy_(terminated)
+        return obs, rewards, dones, self._empty_infos
 
     def load_motions(self, directory: str) -> int:
         """No-op for dummy env. Returns 0."""
@@ -112,27 +235,47 @@ class DummyVecEnv:
         logger.info("DummyVecEnv: load_motion_file('%s') — no-op", path)
         return 0
 
+    def load_motion_files(self, paths: list[str]) -> int:
+        """No-op for dummy env. Returns 0."""
+        logger.info("DummyVecEnv: load_motion_files(%d paths) — no-op", len(paths))
+        return 0
+
     def reset_done_with_motions(self):
         """Reset done envs (same as step auto-reset for dummy env)."""
         pass
 
     def amp_observations(self) -> np.ndarray:
-        """Return random AMP observations."""
-        return self._random_obs()
+        """Return random AMP observations.
+
+        Like the C++ env, the returned array is reused by the next call.
+        """
+        return self._fill_random(self._amp_obs_buf)
 
     def set_task(self, task_type, target):
         """No-op for dummy env."""
         pass
 
+    def _reset_episode_state(self) -> None:
+        """Restart every env's episode for both the numpy and tensor APIs."""
+        self._step_counts[:] = 0
+        self._episode_returns[:] = 0
+        self._step_counts_t.zero_()
+
     def _random_obs(self) -> np.ndarray:
-        return self._rng.standard_normal(
-            (self.num_envs, self.obs_dim)
-        ).astype(np.float32) * 0.1
+        return self._fill_random(self._obs_buf)
+
+    def _random_obs_tensor(self, out: torch.Tensor) -> torch.Tensor:
+        torch.randn(out.shape, generator=self._gen, out=out)
+        return out.mul_(0.1)
 
     def _random_obs_subset(self, count: int) -> np.ndarray:
-        return self._rng.standard_normal(
-            (count, self.obs_dim)
-        ).astype(np.float32) * 0.1
+        return self._fill_random(self._subset_buf[:count])
+
+    def _fill_random(self, out: np.ndarray) -> np.ndarray:
+        """Fill a preallocated float32 buffer (or view) with 0.1-scaled noise."""
+        _get_fill_normal()(out, 0.1, self._fill_seed, self._fill_stream)
+        self._fill_stream += 1
+        return out
 
 
 class VecEnvWrapper:
@@ -140,6 +283,8 @@ class VecEnvWrapper:
 
     Provides a consistent API regardless of whether the C++ physics backend
     is available. When the C++ module is missing, falls back to DummyVecEnv.
+    ``reset``, ``step`` and ``amp_observations`` are bound per instance to the
+    chosen backend (see _bind_backend).
 
     Args:
         num_envs: Number of parallel environments.
@@ -147,6 +292,9 @@ class VecEnvWrapper:
         motions_dir: Optional path to FBX animation directory for episode resets.
         obs_dim: Observation dimension (used by DummyVecEnv fallback).
         action_dim: Action dimension (used by DummyVecEnv fallback).
+        dummy_device: Device the DummyVecEnv fallback generates data on. When
+            it matches the device passed to reset_tensor/step_tensor, results
+            are produced there directly with no host round-trip.
     """
 
     def __init__(
@@ -156,17 +304,36 @@ class VecEnvWrapper:
         motions_dir: Optional[str] = None,
         obs_dim: int = 102,
         action_dim: int = 37,
+        dummy_device: str = "cpu",
     ):
         self.num_envs = num_envs
         self.using_cpp = False
 
+        # Placeholder infos for the C++ env, which reports no episode stats
+        # yet. Shared across steps, so consumers must not mutate it.
+        self._empty_infos = [_EMPTY_INFO] * num_envs
+
+        # Persistent pinned host buffers for step_tensor on CUDA
+        self._pinned: dict[str, torch.Tensor] = {}
+        # C++ output views page-locked in place (name -> (view, tensor));
+        # populated on the first CUDA step_tensor call
+        self._registered: Optional[dict[str, tuple[np.ndarray, torch.Tensor]]] = None
+
         if _has_cpp_env and skeleton_path is not None:
             try:
                 self._env = jolt_training.VecEnv(num_envs, skeleton_path)
                 self.obs_dim = self._env.policy_obs_dim
                 self.action_dim = self._env.action_dim
                 self.amp_obs_dim = self._env.amp_obs_dim
-                self.using_cpp = True
+                # Older builds lack the fused step + motion reset binding
+                self._has_autoreset = hasattr(self._env, "step_with_autoreset")
+                # Persistent views of the C++ output buffers, updated in place
+                # by step_inplace, so stepping builds no new arrays
+                self._has_inplace = hasattr(self._env, "step_inplace")
+                if self._has_inplace:
+                    self._obs_view = self._env.obs_view
+                    self._rewards_view = self._env.rewards_view
+                    self._dones_view = self._env.dones_view
                 logger.info(
                     "Using C++ VecEnv: %d envs, obs_dim=%d, amp_obs_dim=%d, action_dim=%d",
                     num_envs,
@@ -180,6 +347,10 @@ class VecEnvWrapper:
                     n = self._env.load_motions(motions_dir)
                     logger.info("Loaded %d motion clips from %s", n, motions_dir)
 
+                # Only now is the C++ env fully set up; a failure above falls
+                # back to DummyVecEnv with using_cpp still False
+                self.using_cpp = True
+                self._bind_backend()
                 return
             except Exception as e:
                 logger.warning(
@@ -192,6 +363,7 @@ class VecEnvWrapper:
             num_envs=num_envs,
             obs_dim=obs_dim,
             action_dim=action_dim,
+            device=dummy_device,
         )
         self.obs_dim = obs_dim
         self.action_dim = action_dim
@@ -207,30 +379,212 @@ class VecEnvWrapper:
             self.obs_dim,
             self.action_dim,
         )
+        self._bind_backend()
+
+    def _bind_backend(self) -> None:
+        """Bind reset/step/amp_observations to the backend's implementations.
+
+        The backend is fixed at construction, so choosing here keeps the
+        per-step path free of backend checks. The C++ step bindings are also
+        cached as bound methods so each step skips the pybind11 attribute
+        lookup.
+
+        ``step(actions) -> (obs, rewards, dones, infos)`` steps all
+        environments. Environments whose episodes end are reset with random
+        motion frames before returning (the C++ env does this in the same
+        call as the step), so dones reports this step's terminations while
+        obs already holds the new episodes' first observations. dones is a
+        bool array; step_tensor converts it to float32. Actions are
+        expected as a C-contiguous float32 (num_envs, action_dim) array,
+        which is passed to the backend without a copy; other layouts are
+        converted once.
+        """
+        self.reset = self._env.reset
+        self.amp_observations = self._env.amp_observations
+        if not self.using_cpp:
+            self.step = self._env.step
+        elif self._has_inplace:
+            self._step_inplace = self._env.step_inplace
+            self.step = self._step_cpp_inplace
+        elif self._has_autoreset:
+            self._step_cpp_outputs = self._env.step_with_autoreset
+            self.step = self._step_cpp
+        else:
+            self._step_cpp_outputs = self._step_cpp_then_reset
+            self.step = self._step_cpp
+
+    def _step_cpp_inplace(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """C++ step writing into the persistent output views."""
+        self._step_inplace(_as_actions(actions))
+        return self._obs_view, self._rewards_view, self._dones_view, self._empty_infos
 
-    def reset(self) -> np.ndarray:
-        """Reset all environments."""
-        return self._env.reset()
-
-    def step(
+    def _step_cpp(
         self, actions: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
-        """Step all environments with the given actions."""
-        if self.using_cpp:
-            obs, rewards, dones = self._env.step(actions)
-            # Build infos list (C++ env doesn't provide episode stats yet)
-            infos = [{} for _ in range(self.num_envs)]
-            return obs, rewards, dones.astype(np.float32), infos
-        return self._env.step(actions)
+        """C++ step through a binding that returns (obs, rewards, dones)."""
+        obs, rewards, dones = self._step_cpp_outputs(_as_actions(actions))
+        # The C++ env doesn't provide episode stats yet; once it does,
+        # build dicts only for envs that report something, as
+        # DummyVecEnv does.
+        return obs, rewards, dones, self._empty_infos
+
+    def _step_cpp_then_reset(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Step then reset done envs, for builds without step_with_autoreset."""
+        outputs = self._env.step(actions)
+        self._env.reset_done_with_motions()
+        return outputs
+
+    def reset_tensor(self, device: torch.device) -> torch.Tensor:
+        """Reset all environments and return obs as a tensor on ``device``.
+
+        See step_tensor for how results are transferred.
+        """
+        if self._on_dummy_device(device):
+            return self._env.reset_tensor()
+        obs = self.reset()
+        if device.type != "cuda":
+            return self._wrap_host(obs)
+        return self._upload("obs", obs, device)
+
+    def step_tensor(
+        self, actions: torch.Tensor, obs_out: Optional[torch.Tensor] = None
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, list[dict]]:
+        """Step all environments with actions given as a torch tensor.
+
+        Returns obs, rewards and dones as float32 tensors on ``actions.device``
+        that the caller owns; dones cross to the device as bool and are cast
+        there. The exception is a DummyVecEnv generating on that device: its
+        rewards and dones are its own buffers, which the next step
+        overwrites. On CUDA, actions are read back into a persistent pinned
+        host buffer and results are uploaded from persistent pinned buffers
+        with non_blocking copies. Those buffers are only rewritten
+        after the next call's action readback, which is ordered after the
+        uploads on the same stream.
+
+        Args:
+            actions: Actions, shape (num_envs, action_dim).
+            obs_out: Optional preallocated (num_envs, obs_dim) float32 tensor
+                on ``actions.device``. If given, observations are written
+                straight into it and it is returned as obs, avoiding a
+                separate allocation and copy on the caller's side.
+        """
+        device = actions.device
+        if self._on_dummy_device(device):
+            return self._env.step_tensor(actions, obs_out=obs_out)
+        if device.type != "cuda":
+            obs, rewards, dones, infos = self.step(actions.numpy())
+            if obs_out is not None:
+                obs_t = obs_out.copy_(torch.from_numpy(obs))
+            else:
+                obs_t = self._wrap_host(obs)
+            dones_t = torch.from_numpy(dones).float()
+            return obs_t, self._wrap_host(rewards), dones_t, infos
+
+        if self._registered is None:
+            self._register_host_views()
+        actions_host = self._pinned.get("actions")
+        if actions_host is None:
+            actions_host = self._pinned["actions"] = torch.empty(
+                actions.shape, dtype=torch.float32, pin_memory=True
+            )
+        actions_host.copy_(actions)
+        obs, rewards, dones, infos = self.step(actions_host.numpy())
+        return (
+            self._upload("obs", obs, device, out=obs_out),
+            self._upload("rewards", rewards, device),
+            self._upload("dones", dones, device).float(),
+            infos,
+        )
+
+    def _wrap_host(self, value: np.ndarray) -> torch.Tensor:
+        """Copy an env output array into a CPU tensor the caller owns."""
+        # Both envs return arrays backed by buffers they reuse every step
+        return torch.from_numpy(value).clone()
+
+    def _upload(
+        self,
+        name: str,
+        value: np.ndarray,
+        device: torch.device,
+        out: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """Copy an env output array to CUDA through its pinned host buffer.
+
+        Page-locked C++ output views are uploaded directly, skipping the
+        staging copy.
+        """
+        registered = self._registered.get(name) if self._registered else None
+        if registered is not None and registered[0] is value:
+            staged = registered[1]
+        else:
+            staged = self._pinned.get(name)
+            if staged is None:
+                staged = self._pinned[name] = torch.empty_like(
+                    torch.from_numpy(value), pin_memory=True
+                )
+            np.copyto(staged.numpy(), value)
+        if out is not None:
+            return out.copy_(staged, non_blocking=True)
+        return staged.to(device, non_blocking=True)
+
+    def _on_dummy_device(self, device: torch.device) -> bool:
+        """Whether the dummy env generates tensors on this CUDA device."""
+        if self.using_cpp or device.type != "cuda":
+            return False
+        gen_device = self._env.device
+        if gen_device.type != "cuda":
+            return False
+        # A bare "cuda" means the current device; resolve both sides so
+        # "cuda" and "cuda:1" are not both taken for the generator's device
+        current = torch.cuda.current_device()
+        gen_index = current if gen_device.index is None else gen_device.index
+        index = current if device.index is None else device.index
+        return gen_index == index
+
+    def _register_host_views(self) -> None:
+        """Page-lock the persistent C++ obs/reward views for direct uploads.
+
+        The C++ env owns these buffers, so they are registered with CUDA in
+        place (cudaHostRegister) rather than reallocated as pinned memory.
+        That is only valid while their storage never moves; VecEnv allocates
+        the obs and reward buffers once and only writes into them. Like the
+        staging buffers, they are only rewritten by the next step, which
+        runs after the synchronous action readback that follows the uploads
+        on the same stream. The done flags are rewritten around auto-resets
+        and are only num_envs bytes, so they always go through the pinned
+        staging buffer instead.
+        """
+        self._registered = {}
+        if not (self.using_cpp and self._has_inplace):
+            return
+        cudart = torch.cuda.cudart()
+        for name, view in (("obs", self._obs_view), ("rewards", self._rewards_view)):
+            err = cudart.cudaHostRegister(view.ctypes.data, view.nbytes, 0)
+            if int(err) != 0:
+                logger.warning(
+                    "cudaHostRegister failed for %s (error %d); using staging copies",
+                    name,
+                    int(err),
+                )
+                continue
+            self._registered[name] = (view, torch.from_numpy(view))
+
+    def close(self) -> None:
+        """Unregister page-locked C++ buffers. Call before dropping the env."""
+        if self._registered:
+            cudart = torch.cuda.cudart()
+            for view, _ in self._registered.values():
+                cudart.cudaHostUnregister(view.ctypes.data)
+        self._registered = None
 
     def reset_done_with_motions(self):
         """Reset done environments using random motion frames from loaded clips."""
         self._env.reset_done_with_motions()
 
-    def amp_observations(self) -> np.ndarray:
-        """Get current AMP observations for discriminator training."""
-        return self._env.amp_observations()
-
     def load_motions(self, directory: str) -> int:
         """Load FBX animation files from a directory."""
         return self._env.load_motions(directory)
@@ -239,6 +593,15 @@ class VecEnvWrapper:
         """Load animations from a single FBX file."""
         return self._env.load_motion_file(path)
 
+    def load_motion_files(self, paths: list[str]) -> int:
+        """Load animations from several FBX files in one backend call.
+
+        The C++ env reads the files and samples their keyframes concurrently,
+        and releases the GIL for the whole call; the OpenFBX parse itself is
+        serialized, so parsing time does not scale with threads.
+        """
+        return self._env.load_motion_files(paths)
+
     def set_task(self, task_type, target):
         """Set the task goal for all environments."""
         self._env.set_task(task_type, target)